@@ -0,0 +1,97 @@
+-- Formal equivalence miter of cordic_rot_scaled vs its cordic core
+--   A standalone cordic & cordic_rot_scaled are driven by the same (free)
+--   inputs. The reference gain correction ((x * CORDIC_scale) >> (N-1)) is
+--   applied to the standalone cordic outputs over the same 2 cycles & PSL
+--   assertions check valid & outputs match every cycle. Run with SymbiYosys
+--   via scripts/formal_equiv.py
+library ieee;
+  use ieee.std_logic_1164.all;
+  use ieee.numeric_std.all;
+
+entity miter_cordic_rot_scaled is
+  generic (
+    G_ITERATIONS : natural := 16
+  );
+  port (
+    clk          : in  std_logic;
+    reset        : in  std_logic;
+    valid_in     : in  std_logic;
+    x_in         : in  signed(G_ITERATIONS - 1 downto 0);
+    y_in         : in  signed(G_ITERATIONS - 1 downto 0);
+    angle_in     : in  unsigned(31 downto 0);
+    CORDIC_scale : in  signed(G_ITERATIONS - 1 downto 0)
+  );
+end entity miter_cordic_rot_scaled;
+
+architecture formal of miter_cordic_rot_scaled is
+
+  signal valid_core, valid_scl : std_logic;
+  signal cos_core, sin_core    : signed(G_ITERATIONS - 1 downto 0);
+  signal cos_scl, sin_scl      : signed(G_ITERATIONS - 1 downto 0);
+
+  -- reference gain correction of core outputs
+  signal ref_valid_d, ref_valid_dd : std_logic := '0';
+  signal ref_cos_d, ref_sin_d      : signed((2*G_ITERATIONS) - 1 downto 0) := (others => '0');
+  signal ref_cos_dd, ref_sin_dd    : signed(G_ITERATIONS - 1 downto 0) := (others => '0');
+
+begin
+
+  U_core: entity work.cordic
+    generic map (
+      G_ITERATIONS => G_ITERATIONS
+    )
+    port map (
+      clk          => clk,
+      reset        => reset,
+      valid_in     => valid_in,
+      x_in         => x_in,
+      y_in         => y_in,
+      angle_in     => angle_in,
+      valid_out    => valid_core,
+      cos_out      => cos_core,
+      sin_out      => sin_core
+    );
+
+  U_scaled: entity work.cordic_rot_scaled
+    generic map (
+      G_ITERATIONS => G_ITERATIONS
+    )
+    port map (
+      clk          => clk,
+      reset        => reset,
+      valid_in     => valid_in,
+      x_in         => x_in,
+      y_in         => y_in,
+      angle_in     => angle_in,
+      CORDIC_scale => CORDIC_scale,
+      valid_out    => valid_scl,
+      cos_out      => cos_scl,
+      sin_out      => sin_scl
+    );
+
+  S_ref_scale: process(clk)
+  begin
+    if rising_edge(clk) then
+      ref_cos_d  <= cos_core * CORDIC_scale;
+      ref_sin_d  <= sin_core * CORDIC_scale;
+      ref_cos_dd <= resize( shift_right( ref_cos_d, G_ITERATIONS - 1 ), G_ITERATIONS );
+      ref_sin_dd <= resize( shift_right( ref_sin_d, G_ITERATIONS - 1 ), G_ITERATIONS );
+      if reset = '1' then
+        ref_valid_d  <= '0';
+        ref_valid_dd <= '0';
+      else
+        ref_valid_d  <= valid_core;
+        ref_valid_dd <= ref_valid_d;
+      end if;
+    end if;
+  end process S_ref_scale;
+
+  -- PSL properties
+  default clock is rising_edge(clk);
+
+  A_valid_equiv: assert always valid_scl = ref_valid_dd;
+  A_out_equiv:   assert always (valid_scl = '1') ->
+                   (cos_scl = ref_cos_dd and sin_scl = ref_sin_dd);
+  C_out_valid:   cover {valid_scl = '1'};
+
+end architecture formal;
@@ -9,6 +9,8 @@ from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge
 from cocotb.triggers import Timer
 
+import pipeline_model # from <repo>/scripts, added to PYTHONPATH by Makefile
+
 # get generic values exported from Makefile
 # the number of CORDIC rotations/iterations to perform is == to the output
 # bitwidth
@@ -27,6 +29,9 @@ processing_gain = 1
 for i in range(data_bitwidth):
     processing_gain *= np.sqrt(1.0 + (2.0**(-2.0*i)))
 
+# static pipeline latency expected of DUT for given generics
+model = pipeline_model.cordic_vec(G_ITERATIONS=data_bitwidth)
+
 # Convert angle (in degrees) to unsigned integer value for input to CORDIC block
 def degree_to_unsigned_fxp( angle, bitwidth ):
     # Python mod operator works with FP and constrains to positive values:
@@ -85,8 +90,11 @@ async def test_CORDIC_vectoring(dut):
         dut._log.info('Expected Phase ~= %d' % phase_est)
 
         # wait for output data valid and compare to model
+        latency = 0
         while not dut.valid_out.value:
             await RisingEdge(dut.clk)
+            latency += 1
+        assert latency == model.latency, "DUT latency of {} cycles doesn't match model latency of {} cycles!".format(latency, model.latency)
 
         # NOTE: *.value.integer is interpreted as an unsigned integer
         dut_mag_out   = dut.mag_out.value.signed_integer
@@ -4,6 +4,7 @@ library ieee;
   use std.textio.all;
 library work;
   use work.util_pkg.all;
+  use work.sim_pkg.all;
 
 entity tb_FC is
   generic (
@@ -16,7 +17,9 @@ entity tb_FC is
     G_LAYER_IDX    : integer :=  0;
     -- base file system path to weight files for this FC layer, also uses
     -- layer index from above to match file pattern for node's weight file
-    G_BASE_PATH    : string  := "/home/jgentile/src/jhu-masters-thesis/src/hdl-lib/DSP/ML/neural/sim/FC_weights_layer_"
+    G_BASE_PATH    : string  := "/home/jgentile/src/jhu-masters-thesis/src/hdl-lib/DSP/ML/neural/sim/FC_weights_layer_";
+    -- expected latency from static pipeline model, checked when >= 0
+    G_EXP_LATENCY  : integer := -1
   );
 end entity tb_FC;
 
@@ -73,5 +76,9 @@ begin
     wait;
   end process CS_test_inputs;
 
+  -- compare `din_valid` -> `dout_valid` latency to the static pipeline model,
+  -- skipped if G_EXP_LATENCY < 0
+  CS_check_latency: P_check_latency( clk, din_valid, dout_valid, G_EXP_LATENCY );
+
 end architecture behav;
 
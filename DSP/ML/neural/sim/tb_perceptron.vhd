@@ -3,6 +3,7 @@ library ieee;
   use ieee.numeric_std.all;
 library work;
   use work.util_pkg.all;
+  use work.sim_pkg.all;
 
 entity tb_perceptron is
   generic (
@@ -12,7 +13,9 @@ entity tb_perceptron is
     G_NUM_CONNECT  : integer := 32;
     -- accumulator register word size
     G_ACCUM_WIDTH  : integer := 24;
-    G_WEIGHT_PATH  : string   := "/home/jgentile/src/jhu-masters-thesis/src/hdl-lib/DSP/ML/neural/sim/FC_weights_layer_0_node_0.txt"
+    G_WEIGHT_PATH  : string   := "/home/jgentile/src/jhu-masters-thesis/src/hdl-lib/DSP/ML/neural/sim/FC_weights_layer_0_node_0.txt";
+    -- expected latency from static pipeline model, checked when >= 0
+    G_EXP_LATENCY  : integer := -1
   );
 end entity tb_perceptron;
 
@@ -69,5 +72,9 @@ begin
     wait;
   end process;
 
+  -- compare `din_valid` -> `dout_valid` latency to the static pipeline model,
+  -- skipped if G_EXP_LATENCY < 0
+  CS_check_latency: P_check_latency( clk, din_valid, dout_valid, G_EXP_LATENCY );
+
 end behav;
 
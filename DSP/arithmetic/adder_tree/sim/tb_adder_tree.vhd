@@ -12,7 +12,10 @@ context vunit_lib.vunit_context;
 
 entity tb_adder_tree is
   generic (
-    runner_cfg   : string -- VUnit generic interface
+    runner_cfg         : string; -- VUnit generic interface
+    -- expected latencies from static pipeline model, checked when >= 0
+    G_EXP_LATENCY_EVEN : integer := -1;
+    G_EXP_LATENCY_ODD  : integer := -1
   );
 end tb_adder_tree;
 
@@ -104,6 +107,37 @@ begin
     wait;
   end process CS_log_odd_result;
 
+  -- compare `din_valid` -> `dout_valid` latencies to the static pipeline model
+  -- (see `scripts/pipeline_model.py --self-check`)
+  CS_check_latency: process
+    variable V_cycles : natural := 0;
+    variable V_even   : integer := -1;
+    variable V_odd    : integer := -1;
+  begin
+    wait until rising_edge(clk) and din_valid_even = '1';
+    while (V_even < 0 or V_odd < 0) and V_cycles < 100 loop
+      wait until rising_edge(clk);
+      V_cycles := V_cycles + 1;
+      if dout_valid_even = '1' and V_even < 0 then
+        V_even := V_cycles;
+      end if;
+      if dout_valid_odd = '1' and V_odd < 0 then
+        V_odd := V_cycles;
+      end if;
+    end loop;
+    report "Even adder tree latency: " & integer'image(V_even) & " cycles";
+    report "Odd adder tree latency: " & integer'image(V_odd) & " cycles";
+    assert G_EXP_LATENCY_EVEN < 0 or V_even = G_EXP_LATENCY_EVEN
+      report "Even adder tree latency doesn't match model latency of " &
+             integer'image(G_EXP_LATENCY_EVEN) & " cycles!"
+      severity failure;
+    assert G_EXP_LATENCY_ODD < 0 or V_odd = G_EXP_LATENCY_ODD
+      report "Odd adder tree latency doesn't match model latency of " &
+             integer'image(G_EXP_LATENCY_ODD) & " cycles!"
+      severity failure;
+    wait;
+  end process CS_check_latency;
+
   U_DUT_even: entity work.adder_tree
     generic map (
       G_DATA_WIDTH => 16,
@@ -0,0 +1,109 @@
+-- Formal equivalence miter of complex_multiply_mult3 vs complex_multiply_mult4
+--   Both DUTs are driven by the same (free) inputs, mult4's outputs are delayed
+--   to match mult3's longer pipeline & PSL assertions check valid & products
+--   match every cycle. Run with SymbiYosys via scripts/formal_equiv.py
+library ieee;
+  use ieee.std_logic_1164.all;
+  use ieee.numeric_std.all;
+
+entity miter_complex_multiply is
+  generic (
+    G_AWIDTH : natural := 8;
+    G_BWIDTH : natural := 8;
+    G_CONJ_A : boolean := false;
+    G_CONJ_B : boolean := false
+  );
+  port (
+    clk      : in  std_logic;
+    reset    : in  std_logic;
+    ab_valid : in  std_logic;
+    ar       : in  signed(G_AWIDTH - 1 downto 0);
+    ai       : in  signed(G_AWIDTH - 1 downto 0);
+    br       : in  signed(G_BWIDTH - 1 downto 0);
+    bi       : in  signed(G_BWIDTH - 1 downto 0)
+  );
+end entity miter_complex_multiply;
+
+architecture formal of miter_complex_multiply is
+
+  -- difference in pipeline delay (K_PIPE_DELAY) of mult3 & mult4
+  constant K_DELAY_DIFF : integer := 6 - 3;
+
+  type T_prod_dly is array (0 to K_DELAY_DIFF - 1) of signed(G_AWIDTH + G_BWIDTH downto 0);
+
+  signal p_valid_3, p_valid_4 : std_logic;
+  signal pr_3, pi_3           : signed(G_AWIDTH + G_BWIDTH downto 0);
+  signal pr_4, pi_4           : signed(G_AWIDTH + G_BWIDTH downto 0);
+
+  signal valid_4_dly          : std_logic_vector(0 to K_DELAY_DIFF - 1) := (others => '0');
+  signal pr_4_dly, pi_4_dly   : T_prod_dly := (others => (others => '0'));
+
+begin
+
+  U_mult3: entity work.complex_multiply_mult3
+    generic map (
+      G_AWIDTH => G_AWIDTH,
+      G_BWIDTH => G_BWIDTH,
+      G_CONJ_A => G_CONJ_A,
+      G_CONJ_B => G_CONJ_B
+    )
+    port map (
+      clk      => clk,
+      reset    => reset,
+      ab_valid => ab_valid,
+      ar       => ar,
+      ai       => ai,
+      br       => br,
+      bi       => bi,
+      p_valid  => p_valid_3,
+      pr       => pr_3,
+      pi       => pi_3
+    );
+
+  U_mult4: entity work.complex_multiply_mult4
+    generic map (
+      G_AWIDTH => G_AWIDTH,
+      G_BWIDTH => G_BWIDTH,
+      G_CONJ_A => G_CONJ_A,
+      G_CONJ_B => G_CONJ_B
+    )
+    port map (
+      clk      => clk,
+      reset    => reset,
+      ab_valid => ab_valid,
+      ar       => ar,
+      ai       => ai,
+      br       => br,
+      bi       => bi,
+      p_valid  => p_valid_4,
+      pr       => pr_4,
+      pi       => pi_4
+    );
+
+  -- valid delay matches mult3's reset behavior (valid shift reg cleared on reset)
+  S_align_mult4: process(clk)
+  begin
+    if rising_edge(clk) then
+      pr_4_dly(0) <= pr_4;
+      pi_4_dly(0) <= pi_4;
+      for i in 1 to K_DELAY_DIFF - 1 loop
+        pr_4_dly(i) <= pr_4_dly(i - 1);
+        pi_4_dly(i) <= pi_4_dly(i - 1);
+      end loop;
+      if reset = '1' then
+        valid_4_dly <= (others => '0');
+      else
+        valid_4_dly <= p_valid_4 & valid_4_dly(0 to K_DELAY_DIFF - 2);
+      end if;
+    end if;
+  end process S_align_mult4;
+
+  -- PSL properties
+  default clock is rising_edge(clk);
+
+  A_valid_equiv: assert always p_valid_3 = valid_4_dly(K_DELAY_DIFF - 1);
+  A_prod_equiv:  assert always (p_valid_3 = '1') ->
+                   (pr_3 = pr_4_dly(K_DELAY_DIFF - 1) and pi_3 = pi_4_dly(K_DELAY_DIFF - 1));
+  C_prod_valid:  cover {p_valid_3 = '1'};
+
+end architecture formal;
@@ -7,6 +7,9 @@ from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge
 from cocotb.triggers import Timer
 
+import pipeline_model # from <repo>/scripts, added to PYTHONPATH by Makefile
+import vector_store
+
 # get generic values exported from Makefile
 AWIDTH = int(os.environ['AWIDTH'])
 BWIDTH = int(os.environ['BWIDTH'])
@@ -15,6 +18,29 @@ A_MIN  = -(2**(AWIDTH-1))
 A_MAX  =  (2**(AWIDTH-1) - 1)
 B_MIN  = -(2**(BWIDTH-1))
 B_MAX  =  (2**(BWIDTH-1) - 1)
+# static pipeline latency expected of DUT (mult3 or mult4) for given generics
+TOPLEVEL = os.environ['TOPLEVEL']
+model    = getattr(pipeline_model, TOPLEVEL)(G_AWIDTH=AWIDTH, G_BWIDTH=BWIDTH)
+# (optional) golden vector store from create_vectors.py, else random vectors
+VECTORS  = os.environ.get('VECTORS', '')
+
+
+# vectors are (ar, ai, br, bi, pr, pi) integer tuples, kept as Python ints so
+# wide (up to 64b) products aren't rounded like through `complex` floats
+def random_vectors(num):
+    for i in range(num):
+        ar, ai = random.randint(A_MIN, A_MAX), random.randint(A_MIN, A_MAX)
+        br, bi = random.randint(B_MIN, B_MAX), random.randint(B_MIN, B_MAX)
+        yield ar, ai, br, bi, ar*br - ai*bi, ar*bi + ai*br
+
+def stored_vectors(path):
+    vs = vector_store.VectorStore(path)
+    vs.check(component='complex_multiply',
+             generics={'G_AWIDTH': AWIDTH, 'G_BWIDTH': BWIDTH,
+                       'G_CONJ_A': False, 'G_CONJ_B': False})
+    for chunk in vs.chunks():
+        for rec in chunk:
+            yield tuple(int(rec[f]) for f in ('ar', 'ai', 'br', 'bi', 'pr', 'pi'))
 
 
 @cocotb.test()
@@ -24,42 +50,36 @@ async def test_complex_multiply(dut):
     clk = Clock(dut.clk, 10, units="ns") # create 10ns period clock on input port `clk`
     cocotb.fork(clk.start()) # start clk
 
-    dut._log.info("DUT generics: AWIDTH={} | BWIDTH={}".format(AWIDTH, BWIDTH))
+    dut._log.info("DUT {} generics: AWIDTH={} | BWIDTH={}".format(TOPLEVEL, AWIDTH, BWIDTH))
     await RisingEdge(dut.clk) # synchronous with input clk
-    # Verify 10x random signed integers
-    for i in range(10):
-        # create random I/Q values
-        a_real = random.randint(A_MIN, A_MAX)
-        a_imag = random.randint(A_MIN, A_MAX)
-        a_val  = complex( a_real, a_imag )
-        b_real = random.randint(B_MIN, B_MAX)
-        b_imag = random.randint(B_MIN, B_MAX)
-        b_val  = complex( b_real, b_imag )
-        dut._log.info("Inputs: A = {}, B = {}".format(a_val, b_val))
-        expected_out  = a_val * b_val
-        expected_real = expected_out.real
-        expected_imag = expected_out.imag
-        dut._log.info("Expected Output: {}".format(expected_out))
+    # Verify stored golden vectors, or 10x random signed integers
+    vectors = stored_vectors(VECTORS) if VECTORS else random_vectors(10)
+    for ar, ai, br, bi, expected_real, expected_imag in vectors:
+        dut._log.info("Inputs: A = {}{:+d}j, B = {}{:+d}j".format(ar, ai, br, bi))
+        dut._log.info("Expected Output: {}{:+d}j".format(expected_real, expected_imag))
 
         # assign complex values to DUT inputs
-        dut.ar <= a_real
-        dut.ai <= a_imag
-        dut.br <= b_real
-        dut.bi <= b_imag
+        dut.ar <= ar
+        dut.ai <= ai
+        dut.br <= br
+        dut.bi <= bi
 
         dut.ab_valid <= 1 # assert data valid
         await RisingEdge(dut.clk)
         dut.ab_valid <= 0 # deassert data valid
 
         # wait for output data valid and compare to model
+        latency = 0
         while True:
             await RisingEdge(dut.clk) # synchronous with input clk
+            latency += 1
             if dut.p_valid == 1:
                 break
+        assert latency == model.latency, "DUT latency of {} cycles doesn't match model latency of {} cycles!".format(latency, model.latency)
         # NOTE: *.value.integer is interpreted as an unsigned integer
         p_real = dut.pr.value.signed_integer
         p_imag = dut.pi.value.signed_integer
-        dut._log.info("DUT Output: {}".format(complex(p_real, p_imag)))
+        dut._log.info("DUT Output: {}{:+d}j".format(p_real, p_imag))
         assert p_real == expected_real, "Randomized test failed! DUT real output {} doesn't match expected {}".format(p_real, expected_real)
         assert p_imag == expected_imag, "Randomized test failed! DUT imag output {} doesn't match expected {}".format(p_imag, expected_imag)
 
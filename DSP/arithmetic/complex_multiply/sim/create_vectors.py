@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+#
+# Generates a golden vector store (see scripts/vector_store.py) of random
+# complex multiplies for complex_multiply_mult3/mult4, used by both the cocotb
+# testbench (VECTORS=<file>) & tb_complex_multiply_vectors.vhd
+#
+# Usage:
+#   $ python3 create_vectors.py cmult.vec --num 100000000 --awidth 16 --bwidth 16
+#
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../scripts'))
+import vector_store
+
+# record fields: A & B stimulus then expected product P, in the order read by
+# tb_complex_multiply_vectors.vhd
+def vector_fields(awidth, bwidth):
+    in_dtype  = 'int%d' % max(8, 2**int(np.ceil(np.log2(max(awidth, bwidth)))))
+    return [('ar', in_dtype, awidth), ('ai', in_dtype, awidth),
+            ('br', in_dtype, bwidth), ('bi', in_dtype, bwidth),
+            ('pr', 'int64', awidth + bwidth + 1), ('pi', 'int64', awidth + bwidth + 1)]
+
+def create_vectors(path, num, awidth, bwidth, seed, conj_a=False, conj_b=False,
+                   chunk_records=vector_store.CHUNK_RECORDS):
+    if awidth + bwidth + 1 > 64:
+        raise ValueError("Products wider than 64b not supported by vector store")
+    rng      = np.random.default_rng(seed)
+    generics = {'G_AWIDTH': awidth, 'G_BWIDTH': bwidth,
+                'G_CONJ_A': conj_a, 'G_CONJ_B': conj_b}
+    with vector_store.VectorWriter(path, vector_fields(awidth, bwidth),
+                                   component='complex_multiply', generics=generics,
+                                   seed=seed, chunk_records=chunk_records,
+                                   model_version=vector_store.source_version(__file__)) as vw:
+        for start in range(0, num, chunk_records):
+            length = min(chunk_records, num - start)
+            # conjugate applied internally to DUT, stimulus stays as given (and
+            # avoids the most negative value, which can't be negated in `width` bits)
+            ar = rng.integers(-2**(awidth-1), 2**(awidth-1), size=length, dtype=np.int64)
+            ai = rng.integers(-2**(awidth-1) + conj_a, 2**(awidth-1), size=length, dtype=np.int64)
+            br = rng.integers(-2**(bwidth-1), 2**(bwidth-1), size=length, dtype=np.int64)
+            bi = rng.integers(-2**(bwidth-1) + conj_b, 2**(bwidth-1), size=length, dtype=np.int64)
+            ai_c = -ai if conj_a else ai
+            bi_c = -bi if conj_b else bi
+            vw.append(ar=ar, ai=ai, br=br, bi=bi,
+                      pr=ar*br - ai_c*bi_c, pi=ar*bi_c + ai_c*br)
+
+
+if __name__ == "__main__":
+    # execute only if run as a script
+    parser = argparse.ArgumentParser(description='Complex multiply golden vectors')
+    parser.add_argument('file', help='output vector store')
+    parser.add_argument('--num', type=int, default=1000, help='number of vectors')
+    parser.add_argument('--awidth', type=int, default=16, help='G_AWIDTH')
+    parser.add_argument('--bwidth', type=int, default=16, help='G_BWIDTH')
+    parser.add_argument('--seed', type=int, default=1, help='random seed')
+    parser.add_argument('--conj-a', action='store_true', help='G_CONJ_A')
+    parser.add_argument('--conj-b', action='store_true', help='G_CONJ_B')
+    args = parser.parse_args()
+    create_vectors(args.file, args.num, args.awidth, args.bwidth, args.seed,
+                   args.conj_a, args.conj_b)
@@ -0,0 +1,162 @@
+--synthesis translate_off
+
+-- Streams a golden vector store (from create_vectors.py) through the complex
+-- multiplier at one vector per clock & checks every product, e.x. with GHDL:
+--   $ ghdl -a --std=08 util_pkg.vhd vector_store_pkg.vhd complex_multiply_mult*.vhd tb_complex_multiply_vectors.vhd
+--   $ ghdl -r --std=08 tb_complex_multiply_vectors -gG_VECTOR_FILE=cmult.vec
+library ieee;
+  use ieee.std_logic_1164.all;
+  use ieee.numeric_std.all;
+library work;
+  use work.util_pkg.all;
+  use work.vector_store_pkg.all;
+
+entity tb_complex_multiply_vectors is
+  generic (
+    G_AWIDTH      : natural := 16;
+    G_BWIDTH      : natural := 16;
+    G_CONJ_A      : boolean := false;
+    G_CONJ_B      : boolean := false;
+    G_MULT3       : boolean := false; -- DUT is complex_multiply_mult3, else mult4
+    G_VECTOR_FILE : string  := "cmult.vec"
+  );
+end entity tb_complex_multiply_vectors;
+
+architecture behav of tb_complex_multiply_vectors is
+
+  signal clk      : std_logic := '0';
+  signal reset    : std_logic;
+  signal ab_valid : std_logic := '0';
+  signal ar, ai   : signed(G_AWIDTH - 1 downto 0) := (others => '0');
+  signal br, bi   : signed(G_BWIDTH - 1 downto 0) := (others => '0');
+  signal p_valid  : std_logic;
+  signal pr, pi   : signed(G_AWIDTH + G_BWIDTH downto 0);
+  signal sim_end  : boolean := false;
+
+begin
+
+  clk   <= not clk after 5.0 ns when not sim_end else '0';
+  reset <= '1','0' after 100 ns;
+
+  G_DUT_MULT3: if G_MULT3 generate
+    U_DUT: entity work.complex_multiply_mult3
+      generic map (
+        G_AWIDTH => G_AWIDTH,
+        G_BWIDTH => G_BWIDTH,
+        G_CONJ_A => G_CONJ_A,
+        G_CONJ_B => G_CONJ_B
+      )
+      port map (
+        clk      => clk,
+        reset    => reset,
+        ab_valid => ab_valid,
+        ar       => ar,
+        ai       => ai,
+        br       => br,
+        bi       => bi,
+        p_valid  => p_valid,
+        pr       => pr,
+        pi       => pi
+      );
+  else generate
+    U_DUT: entity work.complex_multiply_mult4
+      generic map (
+        G_AWIDTH => G_AWIDTH,
+        G_BWIDTH => G_BWIDTH,
+        G_CONJ_A => G_CONJ_A,
+        G_CONJ_B => G_CONJ_B
+      )
+      port map (
+        clk      => clk,
+        reset    => reset,
+        ab_valid => ab_valid,
+        ar       => ar,
+        ai       => ai,
+        br       => br,
+        bi       => bi,
+        p_valid  => p_valid,
+        pr       => pr,
+        pi       => pi
+      );
+  end generate G_DUT_MULT3;
+
+  -- record fields: ar, ai, br, bi (stimulus) then pr, pi (expected)
+  CS_stimulus: process
+    file     fd    : T_byte_file;
+    variable V_hdr : T_vec_header;
+    variable V_rec : T_slv_2D(0 to 5)(63 downto 0);
+  begin
+    P_vec_open( fd, G_VECTOR_FILE, V_hdr );
+
+    -- store must be generated for the DUT generics (see create_vectors.py)
+    assert V_hdr.num_fields = 6
+      report G_VECTOR_FILE & " has " & integer'image(V_hdr.num_fields) &
+             " fields, expected 6 (ar, ai, br, bi, pr, pi)" severity failure;
+    for f in 0 to 1 loop
+      assert V_hdr.field_width(f) = G_AWIDTH and V_hdr.field_width(f + 2) = G_BWIDTH
+        report G_VECTOR_FILE & " input fields are " &
+               integer'image(V_hdr.field_width(f)) & "b & " &
+               integer'image(V_hdr.field_width(f + 2)) & "b, doesn't match G_AWIDTH/G_BWIDTH"
+        severity failure;
+    end loop;
+    for f in 4 to 5 loop
+      assert V_hdr.field_width(f) = G_AWIDTH + G_BWIDTH + 1
+        report G_VECTOR_FILE & " product field " & integer'image(f) & " is " &
+               integer'image(V_hdr.field_width(f)) & "b, expected G_AWIDTH + G_BWIDTH + 1"
+        severity failure;
+    end loop;
+    assert F_vec_meta_contains( V_hdr, """G_CONJ_A"": " & boolean'image(G_CONJ_A) ) and
+           F_vec_meta_contains( V_hdr, """G_CONJ_B"": " & boolean'image(G_CONJ_B) )
+      report G_VECTOR_FILE & " conjugates (--conj-a/--conj-b) don't match G_CONJ_A/G_CONJ_B"
+      severity failure;
+
+    wait until reset = '0' and rising_edge(clk);
+
+    for i in 0 to V_hdr.num_records - 1 loop
+      P_vec_read( fd, V_hdr, V_rec );
+      ar       <= resize( signed( V_rec(0) ), G_AWIDTH );
+      ai       <= resize( signed( V_rec(1) ), G_AWIDTH );
+      br       <= resize( signed( V_rec(2) ), G_BWIDTH );
+      bi       <= resize( signed( V_rec(3) ), G_BWIDTH );
+      ab_valid <= '1';
+      wait until rising_edge(clk);
+    end loop;
+    ab_valid <= '0';
+    file_close( fd );
+    wait;
+  end process CS_stimulus;
+
+  -- separate handle on same store, so expected results stay in step with DUT
+  -- outputs regardless of pipeline latency
+  CS_check: process
+    file     fd       : T_byte_file;
+    variable V_hdr    : T_vec_header;
+    variable V_rec    : T_slv_2D(0 to 5)(63 downto 0);
+    variable V_errors : natural := 0;
+  begin
+    P_vec_open( fd, G_VECTOR_FILE, V_hdr );
+    report "Checking " & integer'image(V_hdr.num_records) & " vectors from " & G_VECTOR_FILE;
+
+    for i in 0 to V_hdr.num_records - 1 loop
+      wait until rising_edge(clk) and p_valid = '1';
+      P_vec_read( fd, V_hdr, V_rec );
+      if pr /= resize( signed( V_rec(4) ), pr'length ) or
+         pi /= resize( signed( V_rec(5) ), pi'length ) then
+        V_errors := V_errors + 1;
+        report "Vector " & integer'image(i) & " mismatch: DUT " &
+               to_hstring(pr) & " + j" & to_hstring(pi) & ", expected " &
+               to_hstring(V_rec(4)) & " + j" & to_hstring(V_rec(5)) severity error;
+      end if;
+    end loop;
+    file_close( fd );
+
+    assert V_errors = 0
+      report integer'image(V_errors) & " vector(s) failed!" severity failure;
+    report "SIM COMPLETE!" severity note;
+    sim_end <= true;
+    wait;
+  end process CS_check;
+
+end architecture behav;
+
+--synthesis translate_on
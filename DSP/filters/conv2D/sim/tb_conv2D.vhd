@@ -4,6 +4,7 @@ library ieee;
   use ieee.std_logic_misc.all;
 library work;
   use work.util_pkg.all;
+  use work.sim_pkg.all;
 
 entity tb_conv2D is
   generic (
@@ -14,7 +15,9 @@ entity tb_conv2D is
     G_K_HEIGHT     : integer :=  5;
     G_K_WIDTH      : integer :=  4;
     G_O_HEIGHT     : integer :=  5;
-    G_O_WIDTH      : integer :=  5
+    G_O_WIDTH      : integer :=  5;
+    -- expected latency from static pipeline model, checked when >= 0
+    G_EXP_LATENCY  : integer := -1
   );
 end entity tb_conv2D;
 
@@ -60,14 +63,14 @@ begin
 
   U_DUT: entity work.conv2D
     generic map (
-      G_DATA_WIDTH   => 16,
-      G_WEIGHT_WIDTH =>  8,
-      G_I_HEIGHT     =>  9,
-      G_I_WIDTH      =>  8,
-      G_K_HEIGHT     =>  5,
-      G_K_WIDTH      =>  4,
-      G_O_HEIGHT     =>  5,
-      G_O_WIDTH      =>  5
+      G_DATA_WIDTH   => G_DATA_WIDTH,
+      G_WEIGHT_WIDTH => G_WEIGHT_WIDTH,
+      G_I_HEIGHT     => G_I_HEIGHT,
+      G_I_WIDTH      => G_I_WIDTH,
+      G_K_HEIGHT     => G_K_HEIGHT,
+      G_K_WIDTH      => G_K_WIDTH,
+      G_O_HEIGHT     => G_O_HEIGHT,
+      G_O_WIDTH      => G_O_WIDTH
     )
     port map (
       clk            => clk,
@@ -99,4 +102,8 @@ begin
     wait;
   end process CS_test_inputs;
 
+  -- compare `din_valid` -> `dout_valid` latency to the static pipeline model,
+  -- skipped if G_EXP_LATENCY < 0
+  CS_check_latency: P_check_latency( clk, din_valid, dout_valid, G_EXP_LATENCY );
+
 end behav;
@@ -3,8 +3,13 @@ library ieee;
   use ieee.numeric_std.all;
 library work;
   use work.util_pkg.all;
+  use work.sim_pkg.all;
 
 entity tb_IQRD_3x3 is
+  generic (
+    -- expected latency from static pipeline model, checked when >= 0
+    G_EXP_LATENCY : integer := -1
+  );
 end entity tb_IQRD_3x3;
 
 architecture behav of tb_IQRD_3x3 is
@@ -36,6 +41,7 @@ architecture behav of tb_IQRD_3x3 is
   signal b_imag       : T_signed_2D(G_M - 1 downto 0)
                                    (G_DATA_WIDTH - 1 downto 0);
   signal b_valid      : std_logic;
+  signal Ab_valid     : std_logic; -- both inputs valid
   signal b_ready      : std_logic;
 
   signal x_real       : T_signed_2D(G_N - 1 downto 0)
@@ -151,4 +157,9 @@ begin
     wait;
   end process CS_test_inputs;
 
+  -- compare `A_valid`/`b_valid` -> `x_valid` latency to the static pipeline
+  -- model, skipped if G_EXP_LATENCY < 0
+  Ab_valid <= A_valid and b_valid;
+  CS_check_latency: P_check_latency( clk, Ab_valid, x_valid, G_EXP_LATENCY );
+
 end architecture behav;
@@ -0,0 +1,135 @@
+-- Formal equivalence miter of dot_product_real vs a per-element MAC
+--   Input vectors (free inputs) accepted while the MAC is idle are tracked
+--   through dot_product_real's pipeline & also accumulated one element per
+--   clk by a reference multiply-accumulate. PSL assertions check the tracked
+--   vector's dot_product_real output arrives after the expected latency & is
+--   equal to the MAC result. Run with SymbiYosys via scripts/formal_equiv.py
+library ieee;
+  use ieee.std_logic_1164.all;
+  use ieee.numeric_std.all;
+library work;
+  use work.util_pkg.all;
+
+entity miter_dot_product_real is
+  generic (
+    G_AWIDTH  : natural := 8;
+    G_BWIDTH  : natural := 8;
+    G_VEC_LEN : natural := 4;
+    G_REG_IN  : boolean := true;
+    G_SIGNED  : boolean := false
+  );
+  port (
+    clk       : in  std_logic;
+    din_valid : in  std_logic;
+    din_a     : in  T_slv_2D(G_VEC_LEN - 1 downto 0)(G_AWIDTH - 1 downto 0);
+    din_b     : in  T_slv_2D(G_VEC_LEN - 1 downto 0)(G_BWIDTH - 1 downto 0)
+  );
+end entity miter_dot_product_real;
+
+architecture formal of miter_dot_product_real is
+
+  constant K_OUT_WIDTH : natural := F_clog2(G_VEC_LEN) + G_AWIDTH + G_BWIDTH;
+  -- input register (optional) + products + adder tree stages
+  function F_latency return natural is
+  begin
+    if G_REG_IN then
+      return 2 + F_clog2(G_VEC_LEN);
+    end if;
+    return 1 + F_clog2(G_VEC_LEN);
+  end function;
+  constant K_LATENCY   : natural := F_latency;
+
+  signal dout_valid : std_logic;
+  signal dout       : std_logic_vector(K_OUT_WIDTH - 1 downto 0);
+
+  -- transaction tracking
+  signal busy       : std_logic := '0';
+  signal track      : std_logic;
+  signal track_sr   : std_logic_vector(0 to K_LATENCY - 1) := (others => '0');
+  signal dut_done   : std_logic := '0';
+  signal dut_result : std_logic_vector(K_OUT_WIDTH - 1 downto 0) := (others => '0');
+
+  -- reference per-element MAC
+  signal mac_a      : T_slv_2D(G_VEC_LEN - 1 downto 0)(G_AWIDTH - 1 downto 0) := (others => (others => '0'));
+  signal mac_b      : T_slv_2D(G_VEC_LEN - 1 downto 0)(G_BWIDTH - 1 downto 0) := (others => (others => '0'));
+  signal mac_idx    : natural range 0 to G_VEC_LEN := G_VEC_LEN;
+  signal mac_acc    : std_logic_vector(K_OUT_WIDTH - 1 downto 0) := (others => '0');
+  signal mac_done   : std_logic := '0';
+
+begin
+
+  U_DUT: entity work.dot_product_real
+    generic map (
+      G_AWIDTH  => G_AWIDTH,
+      G_BWIDTH  => G_BWIDTH,
+      G_VEC_LEN => G_VEC_LEN,
+      G_REG_IN  => G_REG_IN,
+      G_SIGNED  => G_SIGNED
+    )
+    port map (
+      clk        => clk,
+      reset      => '0',
+      din_valid  => din_valid,
+      din_a      => din_a,
+      din_b      => din_b,
+      dout_valid => dout_valid,
+      dout       => dout
+    );
+
+  -- track one vector at a time, until both results are checked
+  track <= din_valid and not busy;
+
+  S_track: process(clk)
+  begin
+    if rising_edge(clk) then
+      track_sr <= track & track_sr(0 to K_LATENCY - 2);
+      if track_sr(K_LATENCY - 1) = '1' then
+        dut_result <= dout;
+        dut_done   <= '1';
+      end if;
+
+      if track = '1' then
+        busy <= '1';
+      elsif dut_done = '1' and mac_done = '1' then
+        busy     <= '0';
+        dut_done <= '0';
+      end if;
+    end if;
+  end process S_track;
+
+  S_MAC: process(clk)
+    variable V_product : std_logic_vector(G_AWIDTH + G_BWIDTH - 1 downto 0);
+  begin
+    if rising_edge(clk) then
+      if track = '1' then
+        mac_a    <= din_a;
+        mac_b    <= din_b;
+        mac_idx  <= 0;
+        mac_acc  <= (others => '0');
+        mac_done <= '0';
+      elsif mac_idx < G_VEC_LEN then
+        if G_SIGNED then
+          V_product := std_logic_vector( signed( mac_a(mac_idx) ) * signed( mac_b(mac_idx) ) );
+          mac_acc   <= std_logic_vector( signed( mac_acc ) + resize( signed( V_product ), K_OUT_WIDTH ) );
+        else
+          V_product := std_logic_vector( unsigned( mac_a(mac_idx) ) * unsigned( mac_b(mac_idx) ) );
+          mac_acc   <= std_logic_vector( unsigned( mac_acc ) + resize( unsigned( V_product ), K_OUT_WIDTH ) );
+        end if;
+        mac_idx <= mac_idx + 1;
+        if mac_idx = G_VEC_LEN - 1 then
+          mac_done <= '1';
+        end if;
+      elsif dut_done = '1' and mac_done = '1' then
+        mac_done <= '0';
+      end if;
+    end if;
+  end process S_MAC;
+
+  -- PSL properties
+  default clock is rising_edge(clk);
+
+  A_latency:     assert always (track_sr(K_LATENCY - 1) = '1') -> (dout_valid = '1');
+  A_dot_equiv:   assert always (dut_done = '1' and mac_done = '1') -> (dut_result = mac_acc);
+  C_checked:     cover {dut_done = '1' and mac_done = '1'};
+
+end architecture formal;
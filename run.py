@@ -1,29 +1,103 @@
-from vunit import VUnit
+import os
+import sys
+from glob import glob
+from vunit import VUnit, VUnitCLI
 
-# Create VUnit instance by parsing command line args
-vu = VUnit.from_argv()
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+import pipeline_model
+import result_cache
+
+# Add cached regression options to VUnit command line, e.x. for nightly runs
+# that must re-simulate everything use `$ python3 run.py --force`
+cli = VUnitCLI()
+cli.parser.add_argument('--force', action='store_true',
+                        help='re-run testbenches with cached passing results')
+cli.parser.add_argument('--cache-dir', default='.result_cache',
+                        help='result cache directory')
+cli.parser.add_argument('--cache-size', type=int, default=100,
+                        help='max size of result cache (MB), LRU evicted')
+args = cli.parse_args()
+
+# Component files and VUnit Testbenches to add to library "lib"
+# #TODO: Eventually use blob pattern to include all? -> lib.add_source_files("./vhdl/*/*.vhd")
+sources  = sorted(glob("./util/*.vhd"))
+sources += [
+    "./DSP/arithmetic/adder_tree/hdl/adder_tree.vhd",
+    "./DSP/arithmetic/adder_tree/sim/tb_adder_tree.vhd",
+    "./DSP/CORDIC/rotation_mode/hdl/cordic.vhd",
+    "./DSP/CORDIC/rotation_mode/hdl/cordic_rot_scaled.vhd",
+    "./DSP/CORDIC/rotation_mode/sim/tb_cordic_rot_scaled.vhd",
+    "./DSP/CORDIC/vectoring_mode/hdl/cordic_vec.vhd",
+    "./DSP/CORDIC/vectoring_mode/hdl/cordic_vec_scaled.vhd",
+    "./DSP/CORDIC/vectoring_mode/sim/tb_cordic_vec_scaled.vhd",
+    "./memory-FIFO-SRL/RAM-ROM/single_port/sp_ram.vhd",
+]
+
+# Skip testbenches whose transitive sources are unchanged since they last
+# passed (only when running the full set, explicit test patterns always run)
+cache      = result_cache.ResultCache(args.cache_dir, args.cache_size)
+tb_keys    = {}
+replayed   = []
+full_run   = args.test_patterns in ("*", ["*"])
+for tb_file in [f for f in sources if os.path.basename(f).startswith("tb_")]:
+    tb_name = os.path.splitext(os.path.basename(tb_file))[0]
+    tb_deps = result_cache.hdl_dependencies([tb_file], sources)
+    tb_keys[tb_name] = result_cache.cache_key(tb_deps + [os.path.abspath(__file__),
+                                                        pipeline_model.__file__],
+                                              seed=getattr(args, "seed", None))
+    cached = None if (args.force or not full_run) else cache.lookup(tb_keys[tb_name])
+    if cached is not None:
+        print("Cached pass, skipping: lib.%s" % tb_name)
+        replayed += cached
+        del tb_keys[tb_name]
+
+if full_run:
+    if not tb_keys:
+        print("All testbenches replayed from result cache (use --force to re-run)")
+        if args.xunit_xml is not None:
+            # replace report of previous run, merge_junit appends
+            if os.path.isfile(args.xunit_xml):
+                os.remove(args.xunit_xml)
+            result_cache.merge_junit(args.xunit_xml, replayed)
+        sys.exit(0)
+    args.test_patterns = ["lib.%s.*" % tb_name for tb_name in tb_keys]
+
+# Create VUnit instance from parsed command line args
+vu = VUnit.from_args(args=args)
 
 # Create library "lib"
 lib = vu.add_library("lib")
+lib.add_source_files(sources)
 
-# Add component files and VUnit Testbenches to library "lib"
-# #TODO: Eventually use blob pattern to include all? -> lib.add_source_files("./vhdl/*/*.vhd")
-lib.add_source_files("./util/*.vhd")
-lib.add_source_files("./DSP/arithmetic/adder_tree/hdl/adder_tree.vhd")
-lib.add_source_files("./DSP/arithmetic/adder_tree/sim/tb_adder_tree.vhd")
-lib.add_source_files("./DSP/CORDIC/rotation_mode/hdl/cordic.vhd")
-lib.add_source_files("./DSP/CORDIC/rotation_mode/hdl/cordic_rot_scaled.vhd")
-lib.add_source_files("./DSP/CORDIC/rotation_mode/sim/tb_cordic_rot_scaled.vhd")
-lib.add_source_files("./DSP/CORDIC/vectoring_mode/hdl/cordic_vec.vhd")
-lib.add_source_files("./DSP/CORDIC/vectoring_mode/hdl/cordic_vec_scaled.vhd")
-lib.add_source_files("./DSP/CORDIC/vectoring_mode/sim/tb_cordic_vec_scaled.vhd")
-lib.add_source_files("./memory-FIFO-SRL/RAM-ROM/single_port/sp_ram.vhd")
+# check DUT latencies against static pipeline models (scripts/pipeline_model.py)
+tb_adder_tree = lib.test_bench("tb_adder_tree")
+tb_adder_tree.set_generic("G_EXP_LATENCY_EVEN", pipeline_model.adder_tree(16, 8).latency)
+tb_adder_tree.set_generic("G_EXP_LATENCY_ODD",  pipeline_model.adder_tree(16, 9).latency)
 
 # GHDL options
 #vu.set_compile_option("ghdl.flags", ["--std=08", "--enable-openieee"])
 #vu.set_compile_option("ghdl.a_flags", ["--enable-openieee"])
 #vu.set_compile_option("ghdl.flags", ["--ieee=synopsys", "-frelaxed-rules"])
 
-# Run VUnit function
-vu.main()
+def post_run(results):
+    # record testbenches where every test passed into result cache, only for
+    # full runs since test patterns may select a subset of a bench's tests
+    if not full_run:
+        return
+    tests = results.get_report().tests
+    for tb_name, key in tb_keys.items():
+        tb_tests = {name: t for name, t in tests.items()
+                    if name.startswith("lib.%s." % tb_name)}
+        cache.store(key, [result_cache.testcase("lib.%s" % tb_name,
+                                                name.split(".", 2)[2],
+                                                t.time,
+                                                None if t.status == "passed" else t.status)
+                          for name, t in tb_tests.items()])
 
+# Run VUnit function, then replay cached results into xUnit output
+try:
+    vu.main(post_run=post_run)
+except SystemExit:
+    if (args.xunit_xml is not None) and replayed:
+        result_cache.merge_junit(args.xunit_xml, replayed)
+    raise
@@ -0,0 +1,142 @@
+#!/usr/bin/python3
+#
+# Runs cocotb testbenches (Makefile based, see `*/sim/Makefile`), skipping any
+# testbench/generic/seed combination with a cached passing result whose HDL
+# sources & Python testbench module haven't changed (see result_cache.py).
+# Skipped benches have their stored results replayed into the JUnit output.
+#
+# Usage:
+#   $ python3 scripts/cocotb_regression.py --xunit-xml cocotb_results.xml
+#   $ python3 scripts/cocotb_regression.py --force   # e.x. nightly full run
+#
+import argparse
+import os
+import re
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+import result_cache
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (cocotb sim dir, Makefile variable overrides for DUT generics/toplevel)
+REGRESSION = [
+    ('DSP/CORDIC/rotation_mode/sim',        {'ITERATIONS': 16}),
+    ('DSP/CORDIC/vectoring_mode/sim',       {'ITERATIONS': 16}),
+    ('DSP/arithmetic/complex_multiply/sim', {'TOPLEVEL': 'complex_multiply_mult4'}),
+    ('DSP/arithmetic/complex_multiply/sim', {'TOPLEVEL': 'complex_multiply_mult3'}),
+    ('DSP/arithmetic/complex_MAC/sim',      {}),
+]
+
+
+def parse_makefile(sim_path):
+    """ MODULE & TOPLEVEL names plus `?=` default variables of a cocotb Makefile """
+    with open(os.path.join(sim_path, 'Makefile')) as fd:
+        text = fd.read()
+    # [ \t]* so empty defaults (e.x. `VECTORS ?=`) don't match into the next line
+    module   = re.search(r'^MODULE[ \t]*:?=[ \t]*(\S+)', text, re.MULTILINE).group(1)
+    toplevel = re.search(r'^TOPLEVEL[ \t]*\??:?=[ \t]*(\S+)', text, re.MULTILINE).group(1)
+    defaults = dict(re.findall(r'^(\w+)[ \t]*\?=[ \t]*(\S*)', text, re.MULTILINE))
+    defaults.pop('DOT_BINARY', None)
+    return module, toplevel, defaults
+
+
+def make_variables(defaults, overrides, sim):
+    """ Values make uses for `?=` variables: command line overrides, then the
+    environment (`?=` doesn't assign variables already set), then defaults """
+    make_vars = {k: os.environ.get(k, v) for k, v in defaults.items()}
+    make_vars.update({k: str(v) for k, v in overrides.items()})
+    make_vars['SIM'] = sim
+    return make_vars
+
+
+def bench_key(sim_path, module, toplevel, make_vars, seed, hdl_files):
+    # HDL: the toplevel entity/module & everything it instantiates
+    top_files = result_cache.design_units(hdl_files).get(toplevel.lower(), ())
+    hdl_deps  = result_cache.hdl_dependencies(top_files, hdl_files)
+    # Python: testbench module & any local modules it imports
+    py_deps   = result_cache.python_dependencies(
+                  os.path.join(sim_path, module + '.py'),
+                  [sim_path, os.path.join(REPO_ROOT, 'scripts')])
+    makefile  = [os.path.join(sim_path, 'Makefile')]
+    # golden vector store contents, when verifying against one (see vector_store.py)
+    vectors   = os.path.join(sim_path, make_vars['VECTORS']) \
+                if make_vars.get('VECTORS') else None
+    vec_deps  = [vectors] if vectors and os.path.isfile(vectors) else []
+    return result_cache.cache_key(hdl_deps + py_deps + makefile + vec_deps,
+                                  make_vars, seed, root=REPO_ROOT)
+
+
+def run_bench(sim_path, make_vars, seed, sim):
+    """ Runs cocotb Makefile in `sim_path`, returns JUnit testcase elements """
+    env = dict(os.environ, RANDOM_SEED=str(seed))
+    # clean first since generics & toplevel are baked in at elaboration
+    subprocess.run(['make', '-C', sim_path, 'clean-all'], env=env,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    cmd  = ['make', '-C', sim_path, 'SIM=%s' % sim] + \
+           ['%s=%s' % (k, v) for k, v in sorted(make_vars.items())]
+    proc = subprocess.run(cmd, env=env, stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT, universal_newlines=True)
+    results = os.path.join(sim_path, 'results.xml')
+    if not os.path.isfile(results):
+        return [], proc.stdout
+    return ET.parse(results).getroot().findall('.//testcase'), proc.stdout
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Cached cocotb regression')
+    parser.add_argument('--force', action='store_true',
+                        help='re-run all testbenches, ignoring cached results')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='cocotb RANDOM_SEED for all testbenches')
+    parser.add_argument('--sim', default='ghdl', help='cocotb simulator')
+    parser.add_argument('--xunit-xml', help='JUnit output of run & replayed results')
+    parser.add_argument('--cache-dir', default=os.path.join(REPO_ROOT, '.result_cache'),
+                        help='result cache directory')
+    parser.add_argument('--cache-size', type=int, default=100,
+                        help='max size of result cache (MB), LRU evicted')
+    args  = parser.parse_args(argv)
+    cache = result_cache.ResultCache(args.cache_dir, args.cache_size)
+    hdl_files = result_cache.find_hdl_files(REPO_ROOT)
+
+    all_testcases = []
+    num_run = num_cached = num_fail = 0
+    for sim_dir, overrides in REGRESSION:
+        sim_path = os.path.join(REPO_ROOT, sim_dir)
+        module, toplevel, defaults = parse_makefile(sim_path)
+        make_vars = make_variables(defaults, overrides, args.sim)
+        toplevel  = make_vars.get('TOPLEVEL', toplevel)
+        # unique JUnit classname per bench & generics combination
+        label = '%s.%s[%s]' % (module, toplevel, ','.join(
+                  '%s=%s' % (k, v) for k, v in sorted(overrides.items())
+                  if k != 'TOPLEVEL'))
+
+        key = bench_key(sim_path, module, toplevel, make_vars, args.seed, hdl_files)
+        testcases = None if args.force else cache.lookup(key)
+        if testcases is not None:
+            num_cached += 1
+            print('CACHED %s' % label)
+        else:
+            num_run += 1
+            testcases, log = run_bench(sim_path, overrides, args.seed, args.sim)
+            for tc in testcases:
+                tc.set('classname', label)
+            if not testcases: # build/elaboration failed before any test ran
+                testcases = [result_cache.testcase(label, 'build',
+                                                   failure=log[-2000:])]
+            passed = cache.store(key, testcases)
+            print('%s %s' % ('PASS  ' if passed else 'FAIL  ', label))
+            num_fail += 0 if passed else 1
+        all_testcases += testcases
+
+    print('%d run (%d failed), %d replayed from cache' % (num_run, num_fail, num_cached))
+    if args.xunit_xml:
+        if os.path.isfile(args.xunit_xml):
+            os.remove(args.xunit_xml)
+        result_cache.merge_junit(args.xunit_xml, all_testcases)
+    return 1 if num_fail else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
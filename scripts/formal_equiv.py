@@ -0,0 +1,193 @@
+#!/usr/bin/python3
+#
+# Bounded formal equivalence checks between alternative architectures of the
+# same function, using SymbiYosys (sby) & the GHDL Yosys plugin. Each harness
+# is a miter (see `*/formal/miter_*.vhd`) driving both architectures from the
+# same free inputs with PSL assertions that their outputs match; BMC depth is
+# derived from the pipeline latency models (see pipeline_model.py). Passing
+# results are cached by source contents & generics (see result_cache.py).
+#
+# Usage:
+#   $ python3 scripts/formal_equiv.py                      # all harnesses, BMC
+#   $ python3 scripts/formal_equiv.py complex_multiply G_AWIDTH=12 G_BWIDTH=10
+#   $ python3 scripts/formal_equiv.py cordic_rot_scaled --mode prove
+#   $ python3 scripts/formal_equiv.py --load-plugin   # yosys w/o built-in ghdl
+#
+import argparse
+import os
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+import pipeline_model
+import result_cache
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Small default widths keep multiplier equivalence (hard for SAT solvers)
+# tractable, override generics on the command line for wider checks.
+#   top:      miter entity
+#   sources:  VHDL files, in compile order
+#   generics: default miter generics
+#   depth:    BMC/induction depth from generics (pipeline latency + margin)
+#   modes:    supported sby modes (k-induction needs no extra invariants)
+#   xfail:    (optional) reason the check is expected to fail for generics,
+#             reported as XFAIL without failing the run (else None)
+HARNESSES = {
+    'complex_multiply': {
+        'top':      'miter_complex_multiply',
+        'sources':  ['DSP/arithmetic/complex_multiply/hdl/complex_multiply_mult3.vhd',
+                     'DSP/arithmetic/complex_multiply/hdl/complex_multiply_mult4.vhd',
+                     'DSP/arithmetic/complex_multiply/formal/miter_complex_multiply.vhd'],
+        'generics': {'G_AWIDTH': 8, 'G_BWIDTH': 8, 'G_CONJ_A': False, 'G_CONJ_B': False},
+        'depth':    lambda g: pipeline_model.complex_multiply_mult3(**g).latency + 4,
+        'modes':    ('bmc', 'prove', 'cover'),
+    },
+    'cordic_rot_scaled': {
+        'top':      'miter_cordic_rot_scaled',
+        'sources':  ['DSP/CORDIC/rotation_mode/hdl/cordic.vhd',
+                     'DSP/CORDIC/rotation_mode/hdl/cordic_rot_scaled.vhd',
+                     'DSP/CORDIC/rotation_mode/formal/miter_cordic_rot_scaled.vhd'],
+        'generics': {'G_ITERATIONS': 16},
+        'depth':    lambda g: pipeline_model.cordic_rot_scaled(**g).latency + 4,
+        'modes':    ('bmc', 'prove', 'cover'),
+    },
+    'dot_product_real': {
+        'top':      'miter_dot_product_real',
+        'sources':  ['util/util_pkg.vhd',
+                     'DSP/arithmetic/adder_tree/hdl/adder_tree.vhd',
+                     'DSP/linear_algebra/dot_product/hdl/dot_product_real.vhd',
+                     'DSP/linear_algebra/dot_product/formal/miter_dot_product_real.vhd'],
+        'generics': {'G_AWIDTH': 8, 'G_BWIDTH': 8, 'G_VEC_LEN': 4, 'G_REG_IN': True,
+                     'G_SIGNED': False},
+        # reference MAC takes G_VEC_LEN clks, may finish after the DUT
+        'depth':    lambda g: max(pipeline_model.dot_product_real(**g).latency,
+                                  g['G_VEC_LEN']) + 4,
+        'modes':    ('bmc', 'cover'),
+        # adder_tree zero-extends its inputs (adds as unsigned), so sums of
+        # mixed-sign products are wrong, e.x. -1 + 1 -> -256 for 8b products
+        'xfail':    lambda g: 'adder_tree zero-extends signed products'
+                              if g['G_SIGNED'] else None,
+    },
+}
+
+
+def _generic_str(val):
+    if isinstance(val, bool):
+        return 'true' if val else 'false'
+    return str(val)
+
+
+def write_sby(path, harness, generics, depth, engine, load_plugin):
+    """ Writes sby file with one task per supported mode """
+    sources = [os.path.join(REPO_ROOT, f) for f in harness['sources']]
+    lines   = ['[tasks]'] + list(harness['modes']) + ['', '[options]']
+    lines  += ['%s: mode %s' % (m, m) for m in harness['modes']]
+    lines  += ['depth %d' % depth, '', '[engines]', engine, '', '[script]']
+    if load_plugin:
+        lines.append('plugin -i ghdl')
+    lines  += ['ghdl --std=08 %s %s -e %s' % (
+                 ' '.join('-g%s=%s' % (k, _generic_str(v)) for k, v in sorted(generics.items())),
+                 ' '.join(os.path.basename(f) for f in sources), harness['top']),
+               'prep -top %s' % harness['top'], '', '[files]'] + sources
+    with open(path, 'w') as fd:
+        fd.write('\n'.join(lines) + '\n')
+
+
+def run_harness(name, generics, mode, depth, args):
+    """ Runs sby task `mode` of harness `name`, returns JUnit testcase elements """
+    harness = HARNESSES[name]
+    os.makedirs(args.out_dir, exist_ok=True)
+    sby_file = os.path.join(args.out_dir, name + '.sby')
+    write_sby(sby_file, harness, generics, depth, args.engine, args.load_plugin)
+    # `-f` overwrites previous `<name>_<mode>/` work directory
+    proc = subprocess.run(['sby', '-f', os.path.basename(sby_file), mode],
+                          cwd=args.out_dir, stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT, universal_newlines=True)
+    label = 'formal.%s[%s]' % (name, ','.join(
+              '%s=%s' % (k, _generic_str(v)) for k, v in sorted(generics.items())))
+    # sby exits non-zero on a failed assertion, unreached cover or tool error,
+    # counterexample trace is written to `<name>_<mode>/engine_0/`
+    failure  = None if proc.returncode == 0 else proc.stdout[-2000:]
+    testcase = result_cache.testcase(label, '%s_depth%d' % (mode, depth), failure=failure)
+    xfail    = harness.get('xfail', lambda g: None)(generics)
+    if xfail and failure is not None:
+        # known failure, reported as skipped (& not cached) so it doesn't fail the run
+        testcase.remove(testcase.find('failure'))
+        ET.SubElement(testcase, 'skipped', message='expected failure: %s' % xfail)
+    return [testcase]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Formal equivalence checks')
+    parser.add_argument('harness', nargs='?', choices=sorted(HARNESSES),
+                        help='harness to run (default: all)')
+    parser.add_argument('generics', nargs='*', metavar='G_NAME=VALUE',
+                        help='miter generic overrides')
+    parser.add_argument('--mode', default='bmc', choices=('bmc', 'prove', 'cover'),
+                        help='sby mode, harnesses not supporting it are skipped')
+    parser.add_argument('--depth', type=int,
+                        help='override BMC/induction depth from latency models')
+    parser.add_argument('--engine', default='smtbmc',
+                        help='sby engine line, e.x. "smtbmc boolector" or "abc pdr"')
+    parser.add_argument('--load-plugin', action='store_true',
+                        help='load GHDL plugin (`plugin -i ghdl`) in yosys script')
+    parser.add_argument('--out-dir', default=os.path.join(REPO_ROOT, 'formal_out'),
+                        help='sby work directory')
+    parser.add_argument('--force', action='store_true',
+                        help='re-run all checks, ignoring cached results')
+    parser.add_argument('--xunit-xml', help='JUnit output of run & replayed results')
+    parser.add_argument('--cache-dir', default=os.path.join(REPO_ROOT, '.result_cache'),
+                        help='result cache directory')
+    parser.add_argument('--cache-size', type=int, default=100,
+                        help='max size of result cache (MB), LRU evicted')
+    args  = parser.parse_args(argv)
+    cache = result_cache.ResultCache(args.cache_dir, args.cache_size)
+
+    if args.generics and not args.harness:
+        parser.error('generic overrides need a harness name')
+    names = [args.harness] if args.harness else sorted(HARNESSES)
+
+    all_testcases = []
+    num_run = num_cached = num_fail = 0
+    for name in names:
+        harness = HARNESSES[name]
+        if args.mode not in harness['modes']:
+            print('SKIP   %s (no %s mode)' % (name, args.mode))
+            continue
+        generics = dict(harness['generics'])
+        for g in args.generics:
+            gname, _, val = g.partition('=')
+            if gname not in generics:
+                parser.error('%s has no generic %s' % (harness['top'], gname))
+            generics[gname] = pipeline_model._parse_generic(val)
+        depth = args.depth or harness['depth'](generics)
+
+        key = result_cache.cache_key(
+                [os.path.join(REPO_ROOT, f) for f in harness['sources']],
+                dict(generics, mode=args.mode, depth=depth, engine=args.engine),
+                root=REPO_ROOT)
+        testcases = None if args.force else cache.lookup(key)
+        if testcases is not None:
+            num_cached += 1
+            print('CACHED %s %s depth=%d' % (name, args.mode, depth))
+        else:
+            num_run += 1
+            testcases = run_harness(name, generics, args.mode, depth, args)
+            passed = cache.store(key, testcases)
+            xfail  = any(tc.find('skipped') is not None for tc in testcases)
+            print('%s %s %s depth=%d' % ('XFAIL ' if xfail else 'PASS  ' if passed else 'FAIL  ',
+                                         name, args.mode, depth))
+            num_fail += 0 if (passed or xfail) else 1
+        all_testcases += testcases
+
+    print('%d run (%d failed), %d replayed from cache' % (num_run, num_fail, num_cached))
+    if args.xunit_xml:
+        if os.path.isfile(args.xunit_xml):
+            os.remove(args.xunit_xml)
+        result_cache.merge_junit(args.xunit_xml, all_testcases)
+    return 1 if num_fail else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,614 @@
+#!/usr/bin/python3
+#
+# Static pipeline latency & resource models of hdl-lib components
+#
+# Each model takes the same generics as its HDL entity (same names & defaults)
+# and returns an `Estimate` of:
+#   + latency: # clk cycles from input `valid` asserted to output `valid`
+#              asserted (e.x. the `sig_valid_sr` depth of a CORDIC engine)
+#   + ii:      initiation interval, # clk cycles before the component can
+#              accept the next input (1 == fully pipelined)
+#   + mults:   # of inferred multipliers
+#   + adders:  # of inferred adders/subtractors (incl. accumulators)
+#   + regs:    # of register bits (flip-flops) in the datapath & control
+#
+# Formulas follow the HDL directly (e.x. `F_clog2()` adder tree depth, or
+# `K_POST_COL_ADD_SZ` in conv2D) so compositions like `ABF_CNN_N9x8x2` are
+# evaluated instantly, and side-channel delays can be sized for components like
+# `static_shift_reg_vec` without hand-counting pipeline stages.
+#
+# Usage:
+#   $ python3 scripts/pipeline_model.py                      # list models
+#   $ python3 scripts/pipeline_model.py adder_tree G_NUM_INPUTS=9
+#   $ python3 scripts/pipeline_model.py ABF_CNN_N9x8x2
+#   $ python3 scripts/pipeline_model.py --self-check         # verify vs. sim
+#
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+
+
+class Estimate:
+    """ Latency, initiation interval & resource counts of a component """
+
+    def __init__(self, name, latency, ii=1, mults=0, adders=0, regs=0, exact=True):
+        self.name    = name
+        self.latency = latency
+        self.ii      = ii
+        self.mults   = mults
+        self.adders  = adders
+        self.regs    = regs
+        # False when latency depends on handshaking/schedule rather than a
+        # fixed pipeline depth (e.x. ready/valid FSMs in the QR systolic array)
+        self.exact   = exact
+
+    def __repr__(self):
+        return ('%s: latency=%d%s, ii=%d, mults=%d, adders=%d, regs=%d' %
+                (self.name, self.latency, '' if self.exact else ' (sched)',
+                 self.ii, self.mults, self.adders, self.regs))
+
+
+def series(name, *stages):
+    """ Components connected output `valid` -> input `valid` """
+    return Estimate(name,
+                    latency = sum(s.latency for s in stages),
+                    ii      = max(s.ii for s in stages),
+                    mults   = sum(s.mults for s in stages),
+                    adders  = sum(s.adders for s in stages),
+                    regs    = sum(s.regs for s in stages),
+                    exact   = all(s.exact for s in stages))
+
+
+def parallel(name, *branches):
+    """ Components fed by the same input `valid`, output taken from slowest """
+    return Estimate(name,
+                    latency = max(b.latency for b in branches),
+                    ii      = max(b.ii for b in branches),
+                    mults   = sum(b.mults for b in branches),
+                    adders  = sum(b.adders for b in branches),
+                    regs    = sum(b.regs for b in branches),
+                    exact   = all(b.exact for b in branches))
+
+
+def replicate(est, count, name=None):
+    """ `count` identical instances in parallel (e.x. a generate loop) """
+    return Estimate(name or '%dx %s' % (count, est.name),
+                    latency = est.latency,
+                    ii      = est.ii,
+                    mults   = est.mults*count,
+                    adders  = est.adders*count,
+                    regs    = est.regs*count,
+                    exact   = est.exact)
+
+
+def align_delay(fast, slow):
+    """ Depth of `static_shift_reg_vec` needed to align `fast` to `slow` """
+    if slow.latency < fast.latency:
+        raise ValueError('%s is faster than %s' % (slow.name, fast.name))
+    return slow.latency - fast.latency
+
+
+# Python equivalents of util_pkg functions -----------------------------------
+def F_clog2(x):
+    # integer(ceil(log2(x))), exact for integer inputs (no float rounding)
+    if x < 1:
+        raise ValueError('F_clog2() undefined for %d' % x)
+    return (x - 1).bit_length()
+
+
+# Memory, FIFOs & SRLs --------------------------------------------------------
+def static_shift_reg_vec(G_DEPTH=32, G_DATA_WIDTH=8):
+    # shifts only while `dvalid` is high, so latency assumes contiguous valids
+    return Estimate('static_shift_reg_vec', latency=G_DEPTH,
+                    regs=G_DEPTH*G_DATA_WIDTH)
+
+
+# DSP/arithmetic --------------------------------------------------------------
+def adder_tree(G_DATA_WIDTH=16, G_NUM_INPUTS=8):
+    if G_NUM_INPUTS < 2:
+        raise ValueError('adder_tree needs G_NUM_INPUTS >= 2')
+    latency = adders = regs = 0
+    width, num = G_DATA_WIDTH, G_NUM_INPUTS
+    while True:
+        # one registered stage of pairwise adds (+1b growth), odd input passes
+        nxt      = (num//2) + (num % 2)
+        latency += 1
+        adders  += num//2
+        regs    += nxt*(width + 1) + 1 # + sig_dvalid
+        if F_clog2(num) == 1: # UG_final_stage
+            break
+        width, num = width + 1, nxt
+    return Estimate('adder_tree', latency=latency, adders=adders, regs=regs)
+
+
+def complex_multiply_mult3(G_AWIDTH=16, G_BWIDTH=18, G_CONJ_A=False, G_CONJ_B=False):
+    K_PIPE_DELAY = 6
+    regs = (4*G_AWIDTH)*2 + (3*G_BWIDTH)*2 + (G_AWIDTH + 1) + 2*(G_BWIDTH + 1) \
+         + 8*(G_AWIDTH + G_BWIDTH + 1) + K_PIPE_DELAY
+    return Estimate('complex_multiply_mult3', latency=K_PIPE_DELAY,
+                    mults=3, adders=5, regs=regs)
+
+
+def complex_multiply_mult4(G_AWIDTH=16, G_BWIDTH=18, G_CONJ_A=False, G_CONJ_B=False):
+    K_PIPE_DELAY = 3
+    regs = 2*G_AWIDTH + 2*G_BWIDTH + 4*(G_AWIDTH + G_BWIDTH) \
+         + 2*(G_AWIDTH + G_BWIDTH + 1) + K_PIPE_DELAY
+    return Estimate('complex_multiply_mult4', latency=K_PIPE_DELAY,
+                    mults=4, adders=2, regs=regs)
+
+
+def complex_mac(G_AWIDTH=16, G_BWIDTH=16, G_MAC_WIDTH=48, G_CONJ_A=False,
+                G_CONJ_B=False, G_MUL_OPT=False):
+    if G_MUL_OPT:
+        mult = complex_multiply_mult3(G_AWIDTH, G_BWIDTH, G_CONJ_A, G_CONJ_B)
+    else:
+        mult = complex_multiply_mult4(G_AWIDTH, G_BWIDTH, G_CONJ_A, G_CONJ_B)
+    acc = Estimate('S_accumulate', latency=1, adders=2, regs=2*G_MAC_WIDTH + 1)
+    return series('complex_mac', mult, acc)
+
+
+# DSP/CORDIC ------------------------------------------------------------------
+def cordic(G_ITERATIONS=16):
+    # S_quad input stage + (G_ITERATIONS - 1) add/sub stages of x, y & z
+    regs = 2*G_ITERATIONS*(G_ITERATIONS + 1) + 32*G_ITERATIONS + G_ITERATIONS
+    return Estimate('cordic', latency=G_ITERATIONS,
+                    adders=3*(G_ITERATIONS - 1), regs=regs)
+
+
+def cordic_rot_scaled(G_ITERATIONS=16):
+    # S_scale_magnitudes: multiply by CORDIC_scale, then shift back down
+    scale = Estimate('S_scale_magnitudes', latency=2, mults=2,
+                     regs=2*(2*G_ITERATIONS) + 2*G_ITERATIONS + 2)
+    return series('cordic_rot_scaled', cordic(G_ITERATIONS), scale)
+
+
+def cordic_vec(G_ITERATIONS=16):
+    # S_pre_cordic (+/- x & y) + (G_ITERATIONS - 1) add/sub stages of x, y & ph
+    regs = 2*G_ITERATIONS*(G_ITERATIONS + 1) + 32*G_ITERATIONS + G_ITERATIONS
+    return Estimate('cordic_vec', latency=G_ITERATIONS,
+                    adders=2 + 3*(G_ITERATIONS - 1), regs=regs)
+
+
+def cordic_vec_scaled(G_ITERATIONS=16):
+    # magnitude scaling, phase delayed alongside (sig_phase_q/qq)
+    scale = Estimate('S_scale_magnitudes', latency=2, mults=1,
+                     regs=(2*G_ITERATIONS) + G_ITERATIONS + 2*32 + 2)
+    return series('cordic_vec_scaled', cordic_vec(G_ITERATIONS), scale)
+
+
+# DSP/filters -----------------------------------------------------------------
+def conv2D(G_DATA_WIDTH=16, G_WEIGHT_WIDTH=8, G_I_HEIGHT=9, G_I_WIDTH=8,
+           G_K_HEIGHT=5, G_K_WIDTH=4, G_O_HEIGHT=5, G_O_WIDTH=5):
+    K_POST_MULT_SZ    = G_DATA_WIDTH + G_WEIGHT_WIDTH
+    K_POST_ROW_ADD_SZ = K_POST_MULT_SZ + F_clog2(G_K_WIDTH)
+    row_adders = replicate(adder_tree(K_POST_MULT_SZ, G_K_WIDTH), G_K_HEIGHT)
+    col_adder  = adder_tree(K_POST_ROW_ADD_SZ, G_K_HEIGHT)
+    depth      = row_adders.latency + col_adder.latency
+    num_outs   = G_O_HEIGHT*G_O_WIDTH
+    # S_main_FSM: IDLE (1) -> CALC_KERN (1 product/cycle for each output) ->
+    # WAIT_FINAL_ACC until final adder valid drops -> OUT_VALID
+    if num_outs >= depth + 1:
+        t_out_valid = num_outs + depth + 2
+    else:
+        # adder valid not yet high when entering S_WAIT_FINAL_ACC (see #TODO
+        # in conv2D.vhd), output asserted before final accumulations land
+        t_out_valid = num_outs + 1
+    fsm = Estimate('S_main_FSM', latency=t_out_valid + 1,
+                   ii=t_out_valid + 2, # OUT_VALID -> IDLE -> sample din_valid
+                   mults=G_K_HEIGHT*G_K_WIDTH,
+                   regs=G_K_HEIGHT*G_K_WIDTH*K_POST_MULT_SZ + 1 + 2
+                        + 2*(F_clog2(G_O_HEIGHT + 1) + F_clog2(G_O_WIDTH + 1))
+                        + num_outs*G_DATA_WIDTH)
+    return Estimate('conv2D', latency=fsm.latency, ii=fsm.ii, mults=fsm.mults,
+                    adders=row_adders.adders + col_adder.adders,
+                    regs=fsm.regs + row_adders.regs + col_adder.regs)
+
+
+# DSP/linear_algebra ----------------------------------------------------------
+def dot_product_real(G_AWIDTH=16, G_BWIDTH=16, G_VEC_LEN=8, G_REG_IN=True,
+                     G_SIGNED=True):
+    stages = []
+    if G_REG_IN:
+        stages.append(Estimate('S_reg_in', latency=1,
+                               regs=G_VEC_LEN*(G_AWIDTH + G_BWIDTH) + 1))
+    stages.append(Estimate('S_element_wise_product', latency=1, mults=G_VEC_LEN,
+                           regs=G_VEC_LEN*(G_AWIDTH + G_BWIDTH) + 1))
+    stages.append(adder_tree(G_AWIDTH + G_BWIDTH, G_VEC_LEN))
+    return series('dot_product_real', *stages)
+
+
+def dot_product_cmplx(G_AWIDTH=16, G_BWIDTH=16, G_VEC_LEN=8, G_CONJ=True):
+    mults = replicate(complex_multiply_mult4(G_AWIDTH, G_BWIDTH, G_CONJ, False),
+                      G_VEC_LEN)
+    trees = replicate(adder_tree(G_AWIDTH + G_BWIDTH + 1, G_VEC_LEN), 2)
+    return series('dot_product_cmplx', mults, trees)
+
+
+def boundary_cell(G_DATA_WIDTH=16, G_USE_LAMBDA=False):
+    vec = cordic_vec_scaled(G_DATA_WIDTH)
+    # IDLE samples `x_valid` -> WAIT_PHI sees input vectoring valid a cycle
+    # after it lands -> output vectoring -> WAIT_THETA -> OUT_VALID
+    latency = 2*vec.latency + 1
+    regs    = 2*vec.regs + 2*32 + G_DATA_WIDTH + 1 + 2
+    mults   = 2*vec.mults
+    if G_USE_LAMBDA:
+        mults += 1
+        regs  += 2*G_DATA_WIDTH + 1
+    # + IDLE/OUT_VALID handshake cycles with first internal cell
+    return Estimate('boundary_cell', latency=latency, ii=latency + 2,
+                    mults=mults, adders=2*vec.adders, regs=regs)
+
+
+def internal_cell(G_DATA_WIDTH=16, G_USE_LAMBDA=False):
+    rot = cordic_rot_scaled(G_DATA_WIDTH)
+    # IDLE -> CONSUME (input rotator valid) -> real/imag rotators -> OUT_VALID
+    latency = 2*rot.latency + 2
+    regs    = 3*rot.regs + 4*G_DATA_WIDTH + 2*32 + 2
+    return Estimate('internal_cell', latency=latency, ii=latency + 2,
+                    mults=3*rot.mults, adders=3*rot.adders, regs=regs)
+
+
+def weight_extract_cell(G_DATA_WIDTH=16):
+    mult = complex_multiply_mult4(G_DATA_WIDTH, G_DATA_WIDTH)
+    # IDLE -> CONSUME (multiply valid) -> WAIT_CALC -> OUT_VALID
+    latency = mult.latency + 2
+    regs    = mult.regs + 2*(G_DATA_WIDTH + 1) + 2*G_DATA_WIDTH + 1 + 2
+    return Estimate('weight_extract_cell', latency=latency, ii=latency + 1,
+                    mults=mult.mults, adders=mult.adders + 2, regs=regs)
+
+
+def _IQRD_schedule(G_DATA_WIDTH, G_M, G_N, max_cycles=1000000):
+    # Cycle-based walk of the ready/valid FSMs in IQRD.vhd and its cells, with
+    # CORDIC/multiply pipelines reduced to their fixed latencies. Returns the
+    # cycle `x_valid` is first asserted after `A_valid`/`b_valid` in cycle 0.
+    L_vec  = cordic_vec_scaled(G_DATA_WIDTH).latency
+    L_rot  = cordic_rot_scaled(G_DATA_WIDTH).latency
+    L_mult = complex_multiply_mult4(G_DATA_WIDTH, G_DATA_WIDTH).latency
+    cols   = G_N + 3 # BC, (N + 1)x IC/IIC, null-fed IIC
+
+    # cell FSM states & cycles their pipelines assert an output valid
+    state = [['S_IDLE']*cols for _ in range(G_N)]
+    pipe0 = [[set() for _ in range(cols)] for _ in range(G_N)]
+    pipe1 = [[set() for _ in range(cols)] for _ in range(G_N)]
+    w_state = ['S_IDLE']*(G_N + 2) # indexed 2 to G_N + 1, like IQRD.vhd
+    w_pipe  = [set() for _ in range(G_N + 2)]
+    feed_valid = [False]*(G_N + 1) # sig_A_valid & sig_b_valid
+    feed_idx   = [0]*(G_N + 1)
+    top, w_cntr = 'S_IDLE', 0
+
+    # Moore outputs of the cells, from current state
+    def x_ready(r, c):
+        if c == 0: # boundary_cell
+            return state[r][c] == 'S_IDLE'
+        return state[r][c] == 'S_CONSUME'
+
+    def x_valid(r, c):
+        if c == G_N + 2: # right-most IIC always fed NULL samples
+            return True
+        if r == 0:
+            return feed_valid[c] if c <= G_N else True # constant 1 + 0j
+        return state[r - 1][c + 1] == 'S_OUT_VALID'
+
+    def xout_ready(r, c):
+        if r < G_N - 1:
+            return x_ready(r + 1, c - 1)
+        if c - 1 < 2: # sig_X_ready(G_N)(0 & 1) tied to '1'
+            return True
+        return w_state[c - 1] == 'S_CONSUME'
+
+    for t in range(max_cycles):
+        if top == 'S_OUT_VALID':
+            return t
+
+        # input feeders (S_index_A_input_matrix & S_index_b_input_vector)
+        nxt_feed_valid, nxt_feed_idx = list(feed_valid), list(feed_idx)
+        for c in range(G_N + 1):
+            if top == 'S_IDLE':
+                nxt_feed_valid[c], nxt_feed_idx[c] = False, 0
+                continue
+            if feed_valid[c] and x_ready(0, c):
+                if feed_idx[c] == G_M - 1:
+                    nxt_feed_valid[c] = False
+                else:
+                    nxt_feed_idx[c] += 1
+            if top == 'S_CONSUME':
+                nxt_feed_valid[c] = True
+
+        # S_main_FSM
+        nxt_top = top
+        if top == 'S_IDLE' and t == 0:
+            nxt_top = 'S_CONSUME'
+        elif top == 'S_CONSUME':
+            nxt_top = 'S_WAIT_X'
+        elif top == 'S_WAIT_X' and w_state[G_N + 1] == 'S_OUT_VALID':
+            if w_cntr >= G_M - 1:
+                nxt_top, w_cntr = 'S_OUT_VALID', 0
+            else:
+                w_cntr += 1
+
+        # systolic array cells
+        nxt_state = [list(row) for row in state]
+        for r in range(G_N):
+            for c in range(cols):
+                s = state[r][c]
+                if c == 0: # boundary_cell
+                    if s == 'S_IDLE' and x_valid(r, c):
+                        pipe0[r][c].add(t + L_vec)
+                        nxt_state[r][c] = 'S_WAIT_PHI'
+                    elif s == 'S_WAIT_PHI' and t in pipe0[r][c]:
+                        # output vectoring fed by input vectoring valid
+                        pipe1[r][c].add(t + L_vec)
+                        nxt_state[r][c] = 'S_WAIT_THETA'
+                    elif s == 'S_WAIT_THETA' and t in pipe1[r][c]:
+                        nxt_state[r][c] = 'S_OUT_VALID'
+                    elif s == 'S_OUT_VALID' and x_ready(r, 1):
+                        nxt_state[r][c] = 'S_IDLE'
+                    continue
+                # internal_cell, angles valid from cell to the left
+                if s == 'S_IDLE' and x_valid(r, c) and \
+                   state[r][c - 1] == 'S_OUT_VALID':
+                    nxt_state[r][c] = 'S_CONSUME'
+                elif s == 'S_CONSUME':
+                    pipe0[r][c].add(t + L_rot)
+                    nxt_state[r][c] = 'S_WAIT_ROTATIONS'
+                elif s == 'S_WAIT_ROTATIONS':
+                    if t in pipe0[r][c]: # real & imag rotators fed together
+                        pipe1[r][c].add(t + L_rot)
+                    if t in pipe1[r][c]:
+                        nxt_state[r][c] = 'S_OUT_VALID'
+                elif s == 'S_OUT_VALID' and xout_ready(r, c):
+                    nxt_state[r][c] = 'S_IDLE'
+
+        # weight extract cells, `w_ready` tied to '1'
+        nxt_w_state = list(w_state)
+        for c in range(2, G_N + 2):
+            s = w_state[c]
+            if s == 'S_IDLE' and state[G_N - 1][c + 1] == 'S_OUT_VALID':
+                nxt_w_state[c] = 'S_CONSUME'
+            elif s == 'S_CONSUME':
+                w_pipe[c].add(t + L_mult)
+                nxt_w_state[c] = 'S_WAIT_CALC'
+            elif s == 'S_WAIT_CALC' and t in w_pipe[c]:
+                nxt_w_state[c] = 'S_OUT_VALID'
+            elif s == 'S_OUT_VALID':
+                nxt_w_state[c] = 'S_IDLE'
+
+        feed_valid, feed_idx, top = nxt_feed_valid, nxt_feed_idx, nxt_top
+        state, w_state = nxt_state, nxt_w_state
+
+    raise RuntimeError('IQRD schedule did not complete in %d cycles' % max_cycles)
+
+
+def IQRD(G_DATA_WIDTH=16, G_USE_LAMBDA=False, G_M=4, G_N=3):
+    bc  = boundary_cell(G_DATA_WIDTH, G_USE_LAMBDA)
+    ic  = internal_cell(G_DATA_WIDTH, G_USE_LAMBDA)
+    wec = weight_extract_cell(G_DATA_WIDTH)
+    # N rows of 1x BC & (N + 2)x IC/IICs, N weight extract cells
+    cells = [replicate(bc, G_N), replicate(ic, G_N*(G_N + 2)), replicate(wec, G_N)]
+    # registered A & b inputs, output x vector and index/FSM control
+    regs  = 2*G_M*G_N*G_DATA_WIDTH + 2*G_M*G_DATA_WIDTH + 2*G_N*G_DATA_WIDTH \
+          + (G_N + 1)*(F_clog2(G_M) + 1) + F_clog2(G_M) + 2
+    latency = _IQRD_schedule(G_DATA_WIDTH, G_M, G_N)
+    return Estimate('IQRD', latency=latency,
+                    ii=latency + 1, # OUT_VALID -> IDLE (with x_ready = '1')
+                    mults=sum(c.mults for c in cells),
+                    adders=sum(c.adders for c in cells),
+                    regs=regs + sum(c.regs for c in cells),
+                    exact=False)
+
+
+# DSP/ML ----------------------------------------------------------------------
+def ReLU(G_DATA_WIDTH=16):
+    return Estimate('ReLU', latency=1, regs=G_DATA_WIDTH + 1)
+
+
+def perceptron(G_DATA_WIDTH=16, G_WEIGHT_WIDTH=8, G_NUM_CONNECT=32,
+               G_ACCUM_WIDTH=24):
+    # IDLE (1st product) -> ITER_MAC (G_NUM_CONNECT - 1) -> FINAL_ACC -> OUT_VALID
+    latency = G_NUM_CONNECT + 1
+    regs    = F_clog2(G_NUM_CONNECT) + (G_DATA_WIDTH + G_WEIGHT_WIDTH) \
+            + G_ACCUM_WIDTH + 2
+    return Estimate('perceptron', latency=latency, ii=latency + 1,
+                    mults=1, adders=1, regs=regs)
+
+
+def FC(G_DATA_WIDTH=16, G_WEIGHT_WIDTH=8, G_NUM_INPUTS=50, G_NUM_OUTPUTS=32,
+       G_ACCUM_WIDTH=24, G_ACTIVATION='RELU'):
+    node = perceptron(G_DATA_WIDTH, G_WEIGHT_WIDTH, G_NUM_INPUTS, G_ACCUM_WIDTH)
+    if G_ACTIVATION == 'RELU':
+        node = series('node', node, ReLU(G_DATA_WIDTH))
+    elif G_ACTIVATION != 'NONE':
+        raise ValueError('unsupported G_ACTIVATION: %s' % G_ACTIVATION)
+    return replicate(node, G_NUM_OUTPUTS, 'FC')
+
+
+def ABF_CNN_N9x8x2(G_DATA_WIDTH=16):
+    K_WEIGHT_WIDTH = 8
+    conv = conv2D(G_DATA_WIDTH, K_WEIGHT_WIDTH, 9, 8, 5, 4, 5, 5)
+    return series('ABF_CNN_N9x8x2',
+                  parallel('conv2D x2', conv, conv),
+                  FC(G_DATA_WIDTH, K_WEIGHT_WIDTH, 50, 32, 24, 'RELU'),
+                  FC(G_DATA_WIDTH, K_WEIGHT_WIDTH, 32, 16, 24, 'NONE'))
+
+
+MODELS = {f.__name__: f for f in [
+    static_shift_reg_vec,
+    adder_tree, complex_multiply_mult3, complex_multiply_mult4, complex_mac,
+    cordic, cordic_rot_scaled, cordic_vec, cordic_vec_scaled,
+    conv2D,
+    dot_product_real, dot_product_cmplx,
+    boundary_cell, internal_cell, weight_extract_cell, IQRD,
+    ReLU, perceptron, FC, ABF_CNN_N9x8x2,
+]}
+
+
+# Self-check against simulation -----------------------------------------------
+# cocotb testbenches measure `valid` in -> `valid` out latency and assert it
+# matches the model, so the self-check simply runs them for a few generics.
+#   (model, cocotb sim dir, Makefile variables)
+SELF_CHECKS = [
+    ('cordic',     'DSP/CORDIC/rotation_mode/sim',  {'ITERATIONS': 16}),
+    ('cordic',     'DSP/CORDIC/rotation_mode/sim',  {'ITERATIONS': 12}),
+    ('cordic_vec', 'DSP/CORDIC/vectoring_mode/sim', {'ITERATIONS': 16}),
+    ('complex_multiply_mult4', 'DSP/arithmetic/complex_multiply/sim',
+     {'TOPLEVEL': 'complex_multiply_mult4', 'AWIDTH': 16, 'BWIDTH': 16}),
+    ('complex_multiply_mult3', 'DSP/arithmetic/complex_multiply/sim',
+     {'TOPLEVEL': 'complex_multiply_mult3', 'AWIDTH': 16, 'BWIDTH': 18}),
+]
+
+# VHDL testbenches (GHDL) measure the latency of components with derived
+# latencies (adder trees, FSMs) and check it against a `G_EXP_LATENCY` generic
+# set from the model, the adder tree bench is checked by the VUnit run.py.
+#   (model, model generics, testbench, testbench generics, VHDL sources)
+_UTIL       = ['util/util_pkg.vhd', 'util/sim_pkg.vhd']
+_ADDER      = ['DSP/arithmetic/adder_tree/hdl/adder_tree.vhd']
+_PERCEPTRON = ['DSP/ML/neural/hdl/perceptron.vhd']
+_IQRD       = ['DSP/CORDIC/rotation_mode/hdl/cordic.vhd',
+               'DSP/CORDIC/rotation_mode/hdl/cordic_rot_scaled.vhd',
+               'DSP/CORDIC/vectoring_mode/hdl/cordic_vec.vhd',
+               'DSP/CORDIC/vectoring_mode/hdl/cordic_vec_scaled.vhd',
+               'DSP/arithmetic/complex_multiply/hdl/complex_multiply_mult4.vhd',
+               'DSP/linear_algebra/QR/hdl/boundary_cell.vhd',
+               'DSP/linear_algebra/QR/hdl/internal_cell.vhd',
+               'DSP/linear_algebra/QR/hdl/weight_extract_cell.vhd',
+               'DSP/linear_algebra/QR/hdl/IQRD.vhd']
+VHDL_SELF_CHECKS = [
+    ('conv2D', {}, 'tb_conv2D', lambda work_dir: {},
+     _UTIL + _ADDER + ['DSP/filters/conv2D/hdl/conv2D.vhd',
+                       'DSP/filters/conv2D/sim/tb_conv2D.vhd']),
+    ('perceptron', {'G_NUM_CONNECT': 8}, 'tb_perceptron',
+     lambda work_dir: {'G_NUM_CONNECT': 8,
+                       'G_WEIGHT_PATH': _unity_weights(work_dir, 8) + '0_node_0.txt'},
+     _UTIL + _PERCEPTRON + ['DSP/ML/neural/sim/tb_perceptron.vhd']),
+    ('FC', {'G_NUM_INPUTS': 8, 'G_NUM_OUTPUTS': 4}, 'tb_FC',
+     lambda work_dir: {'G_NUM_INPUTS': 8, 'G_NUM_OUTPUTS': 4,
+                       'G_BASE_PATH': _unity_weights(work_dir, 8, 4)},
+     _UTIL + _PERCEPTRON + ['DSP/ML/activation/hdl/ReLU.vhd',
+                            'DSP/ML/layers/FC/hdl/FC.vhd',
+                            'DSP/ML/layers/FC/sim/tb_FC.vhd']),
+    # M & N are constants of the IQRD testbenches
+    ('IQRD', {'G_M': 3, 'G_N': 3}, 'tb_IQRD_3x3', lambda work_dir: {},
+     _UTIL + _IQRD + ['DSP/linear_algebra/QR/sim/tb_IQRD_3x3.vhd']),
+    ('IQRD', {'G_M': 4, 'G_N': 4}, 'tb_IQRD_4x4', lambda work_dir: {},
+     _UTIL + _IQRD + ['DSP/linear_algebra/QR/sim/tb_IQRD_4x4.vhd']),
+]
+
+
+def _unity_weights(work_dir, num_weights, num_nodes=1, width=8):
+    """ Writes `FC_weights_layer_0_node_<i>.txt` weight files of all 1's,
+    returns the base path (`G_BASE_PATH` of FC) """
+    base_path = os.path.join(work_dir, 'FC_weights_layer_')
+    for i in range(num_nodes):
+        with open('%s0_node_%d.txt' % (base_path, i), 'w') as fd:
+            fd.write(('1'.zfill(width) + '\n')*num_weights)
+    return base_path
+
+
+def _generic_str(val):
+    if isinstance(val, bool):
+        return 'true' if val else 'false'
+    return str(val)
+
+
+def self_check_vhdl(repo_root, model, generics, tb, tb_generics, sources):
+    """ Runs VHDL testbench `tb` with model latency under GHDL, True if passed """
+    latency = MODELS[model](**generics).latency
+    with tempfile.TemporaryDirectory() as work_dir:
+        tb_generics = dict(tb_generics(work_dir), G_EXP_LATENCY=latency)
+        cmds = [['ghdl', '-a', '--std=08'] + [os.path.join(repo_root, f) for f in sources],
+                ['ghdl', '-e', '--std=08', tb],
+                ['ghdl', '-r', '--std=08', tb, '--stop-time=10ms'] +
+                ['-g%s=%s' % (k, _generic_str(v)) for k, v in sorted(tb_generics.items())]]
+        for cmd in cmds:
+            try:
+                proc = subprocess.run(cmd, cwd=work_dir, stdout=subprocess.PIPE,
+                                      stderr=subprocess.STDOUT, universal_newlines=True)
+            except FileNotFoundError: # GHDL not installed
+                return False
+            if proc.returncode != 0:
+                return False
+        # latency report also guards against hitting the stop time unchecked
+        return 'Latency matches model' in proc.stdout
+
+
+def self_check(sim='ghdl'):
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    num_fail  = 0
+    for model, sim_dir, make_vars in SELF_CHECKS:
+        sim_path = os.path.join(repo_root, sim_dir)
+        cmd = ['make', '-C', sim_path, 'SIM=%s' % sim] + \
+              ['%s=%s' % (k, v) for k, v in make_vars.items()]
+        # clean first since generics are baked in at elaboration
+        subprocess.run(['make', '-C', sim_path, 'clean-all'],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        proc    = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+        results = os.path.join(sim_path, 'results.xml')
+        passed  = (proc.returncode == 0) and os.path.isfile(results) and \
+                  not ET.parse(results).getroot().findall('.//failure')
+        num_fail += 0 if passed else 1
+        print('%-4s %s %s' % ('PASS' if passed else 'FAIL', model,
+                              ' '.join(cmd[3:])))
+
+    for model, generics, tb, tb_generics, sources in VHDL_SELF_CHECKS:
+        passed = self_check_vhdl(repo_root, model, generics, tb, tb_generics, sources)
+        num_fail += 0 if passed else 1
+        print('%-4s %s' % ('PASS' if passed else 'FAIL', ' '.join(
+                [model] + ['%s=%s' % g for g in sorted(generics.items())] + ['(%s)' % tb])))
+
+    # VUnit adder tree bench, generics set from model in run.py
+    proc   = subprocess.run([sys.executable, os.path.join(repo_root, 'run.py'),
+                             'lib.tb_adder_tree.*'], cwd=repo_root,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+    passed = proc.returncode == 0
+    num_fail += 0 if passed else 1
+    print('%-4s adder_tree G_DATA_WIDTH=16 G_NUM_INPUTS=8,9 (tb_adder_tree)' %
+          ('PASS' if passed else 'FAIL'))
+    return num_fail
+
+
+def _parse_generic(val):
+    if val.lower() in ('true', 'false'):
+        return val.lower() == 'true'
+    try:
+        return int(val, 0)
+    except ValueError:
+        return val
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Static pipeline latency & resource estimates of hdl-lib components')
+    parser.add_argument('component', nargs='?', help='component/entity name')
+    parser.add_argument('generics', nargs='*', metavar='G_NAME=VALUE',
+                        help='generic overrides (HDL defaults otherwise)')
+    parser.add_argument('--self-check', action='store_true',
+                        help='verify model latencies against cocotb/VHDL simulations')
+    parser.add_argument('--sim', default='ghdl', help='simulator for --self-check')
+    args = parser.parse_args(argv)
+
+    if args.self_check:
+        return 1 if self_check(args.sim) else 0
+
+    if args.component is None:
+        print('\n'.join(sorted(MODELS)))
+        return 0
+    if args.component not in MODELS:
+        parser.error('no model for component: %s' % args.component)
+
+    generics = {}
+    for g in args.generics:
+        name, _, val = g.partition('=')
+        generics[name] = _parse_generic(val)
+    try:
+        estimate = MODELS[args.component](**generics)
+    except (TypeError, ValueError) as err: # unknown generic or invalid value
+        parser.error('%s: %s' % (args.component, err))
+    print(estimate)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/python3
+#
+# Content-addressed cache of passing testbench results
+#
+# A testbench's cache key is the hash of:
+#   + its transitive HDL sources (found by scanning VHDL/Verilog design units
+#     & their references, so unrelated changes like `IO_interfaces/PWM` or the
+#     auto-generated `hdl_lib_git_info_pkg` don't invalidate a CORDIC bench)
+#   + its Python testbench module (cocotb module or VUnit `run.py`)
+#   + generics/parameters & random seed it is run with
+#
+# Passing results are stored as JUnit <testcase> elements so they can be
+# replayed into the JUnit/xUnit output of a run that skips them. Failing
+# results are never cached. Least recently used entries are evicted once the
+# cache grows past its size limit.
+#
+import hashlib
+import json
+import os
+import re
+import time
+import xml.etree.ElementTree as ET
+
+HDL_EXTENSIONS = ('.vhd', '.vhdl', '.v', '.sv')
+
+# design unit definitions & references (VHDL is case insensitive)
+_VHDL_DEFINES = re.compile(r'^\s*(?:entity|package)\s+(?!body\b)(\w+)\s+is\b',
+                           re.IGNORECASE | re.MULTILINE)
+_VHDL_REFERS  = re.compile(r'\b(?:entity\s+work\.|component\s+|use\s+work\.|context\s+work\.)(\w+)',
+                           re.IGNORECASE)
+_VLOG_DEFINES = re.compile(r'^\s*module\s+(\w+)', re.MULTILINE)
+_VLOG_REFERS  = re.compile(r'^\s*(\w+)\s*(?:#\s*\(|\w+\s*\()', re.MULTILINE)
+_PY_IMPORTS   = re.compile(r'^\s*(?:import|from)\s+(\w+)', re.MULTILINE)
+
+
+def _is_vhdl(path):
+    return os.path.splitext(path)[1].lower() in ('.vhd', '.vhdl')
+
+
+def _read_stripped(path):
+    with open(path, errors='replace') as fd:
+        text = fd.read()
+    if _is_vhdl(path):
+        return re.sub(r'--.*', '', text)
+    return re.sub(r'//.*', '', text)
+
+
+def find_hdl_files(root):
+    """ All HDL source files under `root` (sorted, for a stable scan order) """
+    hdl_files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and
+                       d not in ('sim_build', 'vunit_out')]
+        hdl_files += [os.path.join(dirpath, f) for f in filenames
+                      if f.lower().endswith(HDL_EXTENSIONS)]
+    return sorted(hdl_files)
+
+
+def design_units(hdl_files):
+    """ Map of (lowercase) entity/package/module name -> defining files """
+    units = {}
+    for path in hdl_files:
+        regex = _VHDL_DEFINES if _is_vhdl(path) else _VLOG_DEFINES
+        for name in regex.findall(_read_stripped(path)):
+            units.setdefault(name.lower(), set()).add(path)
+    return units
+
+
+def hdl_dependencies(top_files, hdl_files):
+    """
+    Transitive closure of HDL sources used by `top_files`, resolved against
+    the design units defined in `hdl_files`. Names defined in more than one
+    file pull in every definition, so the key errs on the side of a re-run.
+    """
+    units   = design_units(hdl_files)
+    deps    = set()
+    pending = [os.path.abspath(f) for f in top_files]
+    units   = {k: {os.path.abspath(p) for p in v} for k, v in units.items()}
+    while pending:
+        path = pending.pop()
+        if path in deps:
+            continue
+        deps.add(path)
+        regex = _VHDL_REFERS if _is_vhdl(path) else _VLOG_REFERS
+        for name in regex.findall(_read_stripped(path)):
+            pending += units.get(name.lower(), ())
+    return sorted(deps)
+
+
+def python_dependencies(module_file, search_dirs):
+    """ `module_file` plus local modules (in `search_dirs`) it imports """
+    deps    = set()
+    pending = [os.path.abspath(module_file)]
+    while pending:
+        path = pending.pop()
+        if path in deps:
+            continue
+        deps.add(path)
+        with open(path) as fd:
+            imports = _PY_IMPORTS.findall(fd.read())
+        for name in imports:
+            for d in search_dirs:
+                candidate = os.path.abspath(os.path.join(d, name + '.py'))
+                if os.path.isfile(candidate):
+                    pending.append(candidate)
+    return sorted(deps)
+
+
+def cache_key(source_files, generics=None, seed=None, root=None):
+    """ SHA-256 over source contents (by path relative to `root`), generics & seed """
+    h = hashlib.sha256()
+    for path in sorted(source_files):
+        name = os.path.relpath(path, root) if root else os.path.basename(path)
+        h.update(name.encode())
+        file_hash = hashlib.sha256()
+        with open(path, 'rb') as fd: # chunked, e.x. for large vector stores
+            for chunk in iter(lambda: fd.read(1 << 20), b''):
+                file_hash.update(chunk)
+        h.update(file_hash.digest())
+    h.update(json.dumps(generics or {}, sort_keys=True, default=str).encode())
+    h.update(repr(seed).encode())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """ Directory of `<key>.xml` JUnit testsuites, evicted least recently used """
+
+    def __init__(self, cache_dir, max_size_mb=100):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_size_mb*1024*1024
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.xml')
+
+    def lookup(self, key):
+        """ Cached (passing) JUnit testcase elements for `key`, else None """
+        path = self._path(key)
+        try:
+            suite = ET.parse(path).getroot()
+        except (OSError, ET.ParseError):
+            return None
+        os.utime(path) # mark as recently used for eviction
+        return suite.findall('testcase')
+
+    def store(self, key, testcases):
+        """ Record passing `testcases`, ignored if any failed or was skipped """
+        if not testcases or any(tc.find(tag) is not None for tc in testcases
+                                for tag in ('failure', 'error', 'skipped')):
+            return False
+        suite = ET.Element('testsuite', name=key, tests=str(len(testcases)),
+                           timestamp=time.strftime('%Y-%m-%dT%H:%M:%S'))
+        suite.extend(testcases)
+        tmp_path = self._path(key) + '.tmp'
+        ET.ElementTree(suite).write(tmp_path, encoding='unicode')
+        os.replace(tmp_path, self._path(key)) # atomic for concurrent runs
+        self.evict()
+        return True
+
+    def evict(self):
+        entries = []
+        for f in os.listdir(self.cache_dir):
+            if f.endswith('.xml'):
+                st = os.stat(os.path.join(self.cache_dir, f))
+                entries.append((st.st_mtime, st.st_size, f))
+        total = sum(e[1] for e in entries)
+        for _, size, f in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.cache_dir, f))
+            total -= size
+
+
+def testcase(classname, name, time_s=0.0, failure=None):
+    tc = ET.Element('testcase', classname=classname, name=name,
+                    time='%0.3f' % time_s)
+    if failure is not None:
+        ET.SubElement(tc, 'failure', message=failure)
+    return tc
+
+
+def merge_junit(path, testcases):
+    """ Append (replayed) `testcases` to JUnit file `path`, created if needed """
+    if os.path.isfile(path):
+        tree  = ET.parse(path)
+        root  = tree.getroot()
+        # cocotb writes <testsuites><testsuite>, VUnit a bare <testsuite>
+        suite = root if root.tag == 'testsuite' else root.find('testsuite')
+        if suite is None:
+            suite = ET.SubElement(root, 'testsuite', name='cached')
+    else:
+        root = suite = ET.Element('testsuite', name='cached')
+        tree = ET.ElementTree(root)
+    suite.extend(testcases)
+    suite.set('tests', str(len(suite.findall('testcase'))))
+    tree.write(path, encoding='unicode')
@@ -0,0 +1,218 @@
+#!/usr/bin/python3
+#
+# Golden vector store: precomputed stimulus & expected results shared between
+# cocotb (Python), VUnit/GHDL and ModelSim testbenches.
+#
+# A store is a single binary file of fixed-size records, one record per test
+# vector, holding typed integer fields (e.x. `ar`, `ai`, `br`, `bi` stimulus &
+# `pr`, `pi` expected outputs). Records are generated & appended in chunks so
+# 10^8 vector suites never have to be held in memory, Python readers memory-map
+# the file (zero-copy) and the VHDL `vector_store_pkg` streams it record by
+# record with a `file of character`.
+#
+# File layout (all values little-endian):
+#
+#   offset  size  description
+#   0       8     magic "HDLVEC01"
+#   8       4     u32 header size (byte offset of first record, 64B aligned)
+#   12      4     u32 number of fields per record
+#   16      4     u32 record size (bytes)
+#   20      4     u32 chunk size (records) used by writer & chunked readers
+#   24      8     u64 number of records
+#   32      4*F   per field: u8 bytes, u8 signed (1) or unsigned (0), u16 HDL bit width
+#   32+4*F  4     u32 metadata size
+#   36+4*F  M     JSON metadata: field names/dtypes, component, generics, seed,
+#                 model version & creation time
+#   ...           zero padding up to header size, then packed records
+#
+# Usage:
+#   $ python3 scripts/vector_store.py <file>   # prints header & metadata
+#
+import argparse
+import hashlib
+import json
+import struct
+import sys
+import time
+
+import numpy as np
+
+MAGIC          = b'HDLVEC01'
+HEADER_ALIGN   = 64
+CHUNK_RECORDS  = 65536
+# supported field types (HDL values are fixed-point integers)
+FIELD_DTYPES   = ('int8', 'int16', 'int32', 'int64', 'uint8', 'uint16', 'uint32', 'uint64')
+
+_FIXED_HEADER  = struct.Struct('<8sIIIIQ')
+_FIELD_DESC    = struct.Struct('<BBH')
+_META_LEN      = struct.Struct('<I')
+
+
+def source_version(*paths):
+    """ Short content hash of model/generator source files, for `model_version` """
+    h = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as fd:
+            h.update(fd.read())
+    return h.hexdigest()[:16]
+
+
+def _record_dtype(fields):
+    # packed (unaligned) little-endian record, same layout the VHDL reader expects
+    return np.dtype([(f['name'], np.dtype(f['dtype']).newbyteorder('<')) for f in fields])
+
+
+class VectorWriter:
+    """
+    Writes a vector store, e.x.:
+        with VectorWriter('cmult.vec', [('ar', 'int16'), ('pr', 'int64', 33)],
+                          component='complex_multiply_mult4',
+                          generics={'G_AWIDTH': 16}, seed=1) as vw:
+            vw.append(ar=ar_chunk, pr=pr_chunk)
+
+    `fields` are (name, dtype) or (name, dtype, HDL bit width) tuples, where
+    the bit width defaults to the full size of the dtype.
+    """
+
+    def __init__(self, path, fields, component, generics=None, seed=None,
+                 model_version=None, chunk_records=CHUNK_RECORDS):
+        self.fields = []
+        for f in fields:
+            name, dtype = f[0], np.dtype(f[1]).name
+            if dtype not in FIELD_DTYPES:
+                raise ValueError("Field '%s' dtype %s not one of %s" % (name, dtype, FIELD_DTYPES))
+            width = f[2] if len(f) > 2 else np.dtype(dtype).itemsize*8
+            self.fields.append({'name': name, 'dtype': dtype, 'width': width})
+        self.dtype         = _record_dtype(self.fields)
+        self.chunk_records = chunk_records
+        self.num_records   = 0
+        self.meta = {
+            'fields'        : self.fields,
+            'component'     : component,
+            'generics'      : generics or {},
+            'seed'          : seed,
+            'model_version' : model_version,
+            'created'       : time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+        meta_bytes = json.dumps(self.meta, sort_keys=True).encode()
+        header     = b''.join(_FIELD_DESC.pack(np.dtype(f['dtype']).itemsize,
+                                               f['dtype'].startswith('int'), f['width'])
+                              for f in self.fields)
+        header    += _META_LEN.pack(len(meta_bytes)) + meta_bytes
+        self.header_bytes = -(-(_FIXED_HEADER.size + len(header)) // HEADER_ALIGN)*HEADER_ALIGN
+
+        self.fd = open(path, 'wb')
+        self._write_fixed_header()
+        self.fd.write(header)
+        self.fd.write(bytes(self.header_bytes - self.fd.tell()))
+        self._pending = []
+
+    def _write_fixed_header(self):
+        self.fd.seek(0)
+        self.fd.write(_FIXED_HEADER.pack(MAGIC, self.header_bytes, len(self.fields),
+                                         self.dtype.itemsize, self.chunk_records,
+                                         self.num_records))
+
+    def append(self, records=None, **columns):
+        """ Appends a structured array `records`, or equal length arrays per field """
+        if records is None:
+            length  = len(next(iter(columns.values())))
+            records = np.empty(length, dtype=self.dtype)
+            for f in self.fields:
+                records[f['name']] = columns[f['name']]
+        self._pending.append(np.asarray(records, dtype=self.dtype))
+        if sum(len(r) for r in self._pending) >= self.chunk_records:
+            self.flush()
+
+    def flush(self):
+        for records in self._pending:
+            records.tofile(self.fd)
+            self.num_records += len(records)
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        end = self.fd.tell()
+        self._write_fixed_header() # final record count
+        self.fd.seek(end)
+        self.fd.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class VectorStore:
+    """
+    Read-only, memory-mapped vector store. Fields are zero-copy views:
+        vs = VectorStore('cmult.vec')
+        vs.check(component='complex_multiply_mult4', generics={'G_AWIDTH': 16})
+        for chunk in vs.chunks():
+            ar, pr = chunk['ar'], chunk['pr']
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as fd:
+            fixed = fd.read(_FIXED_HEADER.size)
+            if len(fixed) < _FIXED_HEADER.size or fixed[:len(MAGIC)] != MAGIC:
+                raise ValueError("%s is not a vector store (bad magic)" % path)
+            (_, self.header_bytes, num_fields, record_bytes,
+             self.chunk_records, self.num_records) = _FIXED_HEADER.unpack(fixed)
+            fd.seek(_FIXED_HEADER.size + num_fields*_FIELD_DESC.size)
+            meta_len, = _META_LEN.unpack(fd.read(_META_LEN.size))
+            self.meta = json.loads(fd.read(meta_len).decode())
+        self.path   = path
+        self.fields = self.meta['fields']
+        self.dtype  = _record_dtype(self.fields)
+        if self.dtype.itemsize != record_bytes:
+            raise ValueError("%s record size %d doesn't match fields %s" %
+                             (path, record_bytes, [f['name'] for f in self.fields]))
+        if self.num_records == 0:
+            self.data = np.empty(0, dtype=self.dtype)
+        else:
+            self.data = np.memmap(path, dtype=self.dtype, mode='r',
+                                  offset=self.header_bytes, shape=(self.num_records,))
+
+    def __len__(self):
+        return self.num_records
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def chunks(self, chunk_records=None):
+        """ Yields consecutive views of (up to) `chunk_records` records """
+        step = chunk_records or self.chunk_records
+        for start in range(0, self.num_records, step):
+            yield self.data[start:start + step]
+
+    def check(self, **expected):
+        """ Raises ValueError if metadata (e.x. component, generics, seed) differs """
+        for key, value in expected.items():
+            stored = self.meta.get(key)
+            if key == 'generics':
+                # only compare generics the caller cares about
+                stored = {k: stored.get(k) for k in value}
+            if json.loads(json.dumps(value)) != stored:
+                raise ValueError("%s was generated with %s=%s, expected %s" %
+                                 (self.path, key, stored, value))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Print vector store header & metadata')
+    parser.add_argument('file', help='vector store file')
+    args = parser.parse_args(argv)
+
+    vs = VectorStore(args.file)
+    print('%s: %d records of %d bytes (header %d bytes, chunks of %d records)' %
+          (args.file, len(vs), vs.dtype.itemsize, vs.header_bytes, vs.chunk_records))
+    for key in ('component', 'generics', 'seed', 'model_version', 'created'):
+        print('  %-14s %s' % (key, vs.meta.get(key)))
+    for f in vs.fields:
+        print('  field %-8s %-7s (%d bits)' % (f['name'], f['dtype'], f['width']))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,53 @@
+-- Package for common testbench (simulation only) procedures
+--   Kept out of util_pkg since it waits on signals & uses std.env, which
+--   synthesis & formal (GHDL Yosys plugin) flows compiling util_pkg reject.
+--
+-- e.x. usage as a concurrent procedure call in a testbench architecture:
+--   CS_check_latency: P_check_latency( clk, din_valid, dout_valid, G_EXP_LATENCY );
+library ieee;
+  use ieee.std_logic_1164.all;
+
+package sim_pkg is
+
+  -- Compares the `din_valid` -> `dout_valid` latency (in rising `clk` edges
+  -- from the first input until the first output is seen) of a DUT to
+  -- `exp_latency`, e.x. from the static pipeline model (see
+  -- `scripts/pipeline_model.py --self-check`). Ends the simulation once the
+  -- latency matches, fails it otherwise, & is skipped if `exp_latency` < 0.
+  procedure P_check_latency( signal clk         : in std_logic;
+                             signal din_valid   : in std_logic;
+                             signal dout_valid  : in std_logic;
+                                    exp_latency : in integer );
+
+end sim_pkg;
+
+package body sim_pkg is
+
+  procedure P_check_latency( signal clk         : in std_logic;
+                             signal din_valid   : in std_logic;
+                             signal dout_valid  : in std_logic;
+                                    exp_latency : in integer ) is
+    variable V_cycles : natural := 0;
+  begin
+    if exp_latency < 0 then
+      wait;
+    end if;
+    wait until rising_edge(clk) and din_valid = '1';
+    loop
+      wait until rising_edge(clk);
+      V_cycles := V_cycles + 1;
+      exit when dout_valid = '1' or V_cycles > 2*exp_latency + 100;
+    end loop;
+    assert V_cycles = exp_latency
+      report "DUT latency of " & integer'image(V_cycles) &
+             " cycles doesn't match model latency of " &
+             integer'image(exp_latency) & " cycles!"
+      severity failure;
+    report "Latency matches model: " & integer'image(V_cycles) & " cycles";
+    -- let processes checking the first output on the same edge finish first
+    wait until rising_edge(clk);
+    std.env.finish;
+    wait;
+  end procedure P_check_latency;
+
+end sim_pkg;
@@ -0,0 +1,193 @@
+-- Package for reading golden vector store files (see scripts/vector_store.py)
+--   Vector stores hold precomputed stimulus & expected results as packed,
+--   little-endian integer fields in fixed-size records, so pure-HDL benches
+--   stream the same vectors used by cocotb testbenches & Python models.
+--
+-- e.x. usage in a testbench process:
+--   file     fd    : T_byte_file;
+--   variable V_hdr : T_vec_header;
+--   variable V_rec : T_slv_2D(0 to 5)(63 downto 0);
+--   ...
+--   P_vec_open( fd, G_VECTOR_FILE, V_hdr );
+--   for i in 0 to V_hdr.num_records - 1 loop
+--     P_vec_read( fd, V_hdr, V_rec );
+--     ar <= resize( signed( V_rec(0) ), G_AWIDTH );
+--     ...
+--   end loop;
+--   file_close( fd );
+library ieee;
+  use ieee.std_logic_1164.all;
+  use ieee.numeric_std.all;
+library work;
+  use work.util_pkg.all;
+
+package vector_store_pkg is
+
+  -- raw byte access to binary files (supported by GHDL & ModelSim)
+  type T_byte_file is file of character;
+
+  constant K_VEC_MAGIC      : string  := "HDLVEC01";
+  constant K_VEC_MAX_FIELDS : integer := 64;
+  constant K_VEC_MAX_META   : integer := 4096; -- JSON metadata chars kept
+
+  type T_vec_header is record
+    header_bytes  : natural; -- byte offset of first record
+    num_fields    : natural;
+    record_bytes  : natural;
+    chunk_records : natural;
+    num_records   : natural;
+    field_bytes   : T_int_2D(0 to K_VEC_MAX_FIELDS - 1);
+    field_width   : T_int_2D(0 to K_VEC_MAX_FIELDS - 1); -- HDL bit width
+    field_signed  : boolean_vector(0 to K_VEC_MAX_FIELDS - 1);
+    meta_len      : natural;
+    metadata      : string(1 to K_VEC_MAX_META); -- JSON, e.x. generics
+  end record T_vec_header;
+
+  -- Opens vector store & reads its header, leaving file at the first record
+  procedure P_vec_open( file     fd        : T_byte_file;
+                                 file_path : string;
+                        variable hdr       : out T_vec_header );
+
+  -- Reads next record, each field sign/zero extended (or truncated) to the
+  -- element length of `fields` (up to 64b), in file field order
+  procedure P_vec_read( file     fd     : T_byte_file;
+                                 hdr    : T_vec_header;
+                        variable fields : out T_slv_2D );
+
+  -- True if the JSON metadata contains `text`, e.x. `"G_CONJ_A": false`
+  -- (Python's json.dumps separators)
+  function F_vec_meta_contains( hdr : T_vec_header; text : string ) return boolean;
+
+end vector_store_pkg;
+
+package body vector_store_pkg is
+
+  -- reads `value'length/8` bytes, least significant byte first
+  procedure P_read_le( file     fd    : T_byte_file;
+                       variable value : out std_logic_vector ) is
+    variable V_char  : character;
+    variable V_value : std_logic_vector(value'length - 1 downto 0);
+  begin
+    for i in 0 to (value'length/8) - 1 loop
+      read( fd, V_char );
+      V_value(i*8 + 7 downto i*8) := std_logic_vector( to_unsigned( character'pos( V_char ), 8 ) );
+    end loop;
+    value := V_value;
+  end P_read_le;
+
+  -- reads unsigned value of `num_bytes` (must fit in a VHDL natural)
+  procedure P_read_natural( file     fd        : T_byte_file;
+                                     num_bytes : positive;
+                            variable value     : out natural ) is
+    variable V_bytes : std_logic_vector(num_bytes*8 - 1 downto 0);
+    variable V_value : unsigned(63 downto 0);
+  begin
+    P_read_le( fd, V_bytes );
+    V_value := resize( unsigned( V_bytes ), V_value'length );
+    assert V_value(63 downto 31) = 0
+      report "Vector store header value exceeds VHDL natural range!" severity failure;
+    value := to_integer( V_value(30 downto 0) );
+  end P_read_natural;
+
+  procedure P_vec_open( file     fd        : T_byte_file;
+                                 file_path : string;
+                        variable hdr       : out T_vec_header ) is
+    variable V_status   : file_open_status;
+    variable V_magic    : string(K_VEC_MAGIC'range);
+    variable V_signed   : natural;
+    variable V_meta_len : natural;
+    variable V_pos      : natural;
+    variable V_char     : character;
+    variable V_bytes    : natural := 0;
+    variable V_hdr      : T_vec_header;
+  begin
+    file_open( V_status, fd, file_path, read_mode );
+    assert V_status = open_ok
+      report "Could not open vector store " & file_path severity failure;
+
+    for i in V_magic'range loop
+      read( fd, V_magic(i) );
+    end loop;
+    assert V_magic = K_VEC_MAGIC
+      report file_path & " is not a vector store (bad magic)" severity failure;
+
+    P_read_natural( fd, 4, V_hdr.header_bytes  );
+    P_read_natural( fd, 4, V_hdr.num_fields    );
+    P_read_natural( fd, 4, V_hdr.record_bytes  );
+    P_read_natural( fd, 4, V_hdr.chunk_records );
+    P_read_natural( fd, 8, V_hdr.num_records   );
+    assert V_hdr.num_fields <= K_VEC_MAX_FIELDS
+      report "Vector store has more than K_VEC_MAX_FIELDS fields!" severity failure;
+
+    for f in 0 to V_hdr.num_fields - 1 loop
+      P_read_natural( fd, 1, V_hdr.field_bytes(f) );
+      P_read_natural( fd, 1, V_signed );
+      P_read_natural( fd, 2, V_hdr.field_width(f) );
+      V_hdr.field_signed(f) := V_signed /= 0;
+      V_bytes := V_bytes + V_hdr.field_bytes(f);
+    end loop;
+    assert V_bytes = V_hdr.record_bytes
+      report file_path & " record size of " & integer'image(V_hdr.record_bytes) &
+             " bytes doesn't match its fields (" & integer'image(V_bytes) & " bytes)"
+      severity failure;
+
+    -- keep JSON metadata (parsed by Python, searched by benches) then skip
+    -- padding up to first record
+    P_read_natural( fd, 4, V_meta_len );
+    V_hdr.metadata := (others => ' ');
+    for i in 1 to V_meta_len loop
+      read( fd, V_char );
+      if i <= K_VEC_MAX_META then
+        V_hdr.metadata(i) := V_char;
+      end if;
+    end loop;
+    V_hdr.meta_len := F_return_smaller( V_meta_len, K_VEC_MAX_META );
+    V_pos := K_VEC_MAGIC'length + 24 + 4*V_hdr.num_fields + 4 + V_meta_len;
+    while V_pos < V_hdr.header_bytes loop
+      read( fd, V_char );
+      V_pos := V_pos + 1;
+    end loop;
+
+    hdr := V_hdr;
+  end P_vec_open;
+
+  procedure P_vec_read( file     fd     : T_byte_file;
+                                 hdr    : T_vec_header;
+                        variable fields : out T_slv_2D ) is
+    variable V_char  : character;
+    variable V_field : std_logic_vector(63 downto 0);
+    variable V_msb   : natural;
+  begin
+    assert fields'length >= hdr.num_fields
+      report "Vector store record has more fields than given array!" severity failure;
+    assert fields(fields'low)'length <= 64
+      report "Vector store fields are at most 64b!" severity failure;
+    assert not endfile( fd )
+      report "Read past last record of vector store!" severity failure;
+
+    for f in 0 to hdr.num_fields - 1 loop
+      V_field := (others => '0');
+      for i in 0 to hdr.field_bytes(f) - 1 loop
+        read( fd, V_char );
+        V_field(i*8 + 7 downto i*8) := std_logic_vector( to_unsigned( character'pos( V_char ), 8 ) );
+      end loop;
+      V_msb := hdr.field_bytes(f)*8 - 1;
+      if hdr.field_signed(f) then
+        V_field(V_field'high downto V_msb) := (others => V_field(V_msb));
+      end if;
+      fields(fields'low + f) := V_field(fields(fields'low)'length - 1 downto 0);
+    end loop;
+  end P_vec_read;
+
+  function F_vec_meta_contains( hdr : T_vec_header; text : string ) return boolean is
+    alias A_text : string(1 to text'length) is text;
+  begin
+    for i in 1 to hdr.meta_len - text'length + 1 loop
+      if hdr.metadata(i to i + text'length - 1) = A_text then
+        return true;
+      end if;
+    end loop;
+    return false;
+  end F_vec_meta_contains;
+
+end vector_store_pkg;